@@ -3,6 +3,7 @@ import asyncio
 
 from upstash_vector import Index, AsyncIndex
 from upstash_vector.core.index_operations import DEFAULT_NAMESPACE
+from upstash_vector.errors import UpstashError
 
 NAMESPACES = [DEFAULT_NAMESPACE, "ns"]
 
@@ -43,6 +44,56 @@ async def assert_eventually_async(assertion, retry_delay=0.5, timeout=5.0):
     raise last_err
 
 
+def success_response(payload):
+    return "Success"
+
+
+class FailingIndex(Index):
+    """
+    An index that does not need a server. It fails the `fail_at`th request,
+    and answers the others with the `response` for their payload. Queries
+    are answered with a single result, and are not counted as requests.
+    """
+
+    def __init__(self, *args, fail_at=2, response=success_response, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_at = fail_at
+        self.response = response
+        self.requests = 0
+
+    def _execute_request(self, payload="", path=""):
+        if path.startswith("/query"):
+            return [{"id": "id-0", "score": 1.0}]
+
+        self.requests += 1
+        if self.requests == self.fail_at:
+            raise UpstashError("failed request")
+
+        return self.response(payload)
+
+
+class FailingAsyncIndex(AsyncIndex):
+    """
+    The async version of `FailingIndex`.
+    """
+
+    def __init__(self, *args, fail_at=2, response=success_response, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fail_at = fail_at
+        self.response = response
+        self.requests = 0
+
+    async def _execute_request_async(self, payload="", path=""):
+        if path.startswith("/query"):
+            return [{"id": "id-0", "score": 1.0}]
+
+        self.requests += 1
+        if self.requests == self.fail_at:
+            raise UpstashError("failed request")
+
+        return self.response(payload)
+
+
 def ensure_ns_exists(index: Index, ns: str):
     """
     Ensures the given namespace exists in the index by upserting some
@@ -3,37 +3,50 @@ from os import environ
 import pytest
 import pytest_asyncio
 
-from tests import NAMESPACES
 from upstash_vector import Index, AsyncIndex
 
+# The sync clients are shared by all the tests, so that their connections
+# are reused. The async clients are bound to the event loop of a test, so
+# they are created per test.
 
-@pytest.fixture
-def index():
+
+@pytest.fixture(scope="session")
+def index_client():
     idx = Index(environ["URL"], environ["TOKEN"])
-    for ns in NAMESPACES:
-        idx.reset(namespace=ns)
-    return idx
+    yield idx
+    idx.close()
+
+
+@pytest.fixture(scope="session")
+def embedding_index_client():
+    idx = Index(environ["EMBEDDING_URL"], environ["EMBEDDING_TOKEN"])
+    yield idx
+    idx.close()
+
+
+@pytest.fixture
+def index(index_client: Index):
+    index_client.reset(all=True)
+    return index_client
 
 
 @pytest_asyncio.fixture
 async def async_index():
     idx = AsyncIndex(environ["URL"], environ["TOKEN"])
-    for ns in NAMESPACES:
-        await idx.reset(namespace=ns)
-    return idx
+    await idx.reset(all=True)
+    yield idx
+    await idx.close()
 
 
 @pytest.fixture
-def embedding_index():
-    idx = Index(environ["EMBEDDING_URL"], environ["EMBEDDING_TOKEN"])
-    for ns in NAMESPACES:
-        idx.reset(namespace=ns)
-    return idx
+def embedding_index(embedding_index_client: Index):
+    embedding_index_client.reset(all=True)
+    return embedding_index_client
 
 
 @pytest_asyncio.fixture
 async def async_embedding_index():
     idx = AsyncIndex(environ["EMBEDDING_URL"], environ["EMBEDDING_TOKEN"])
-    for ns in NAMESPACES:
-        await idx.reset(namespace=ns)
-    return idx
+    await idx.reset(all=True)
+    yield idx
+    await idx.close()
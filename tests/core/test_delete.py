@@ -1,7 +1,10 @@
 import pytest
+from pytest import raises
 
-from tests import NAMESPACES
-from upstash_vector import Index, AsyncIndex
+from tests import NAMESPACES, FailingIndex, FailingAsyncIndex
+from upstash_vector import Index, AsyncIndex, QueryCache
+from upstash_vector.core.index_operations import ID_BATCH_SIZE
+from upstash_vector.errors import UpstashError
 
 
 @pytest.mark.parametrize("ns", NAMESPACES)
@@ -137,3 +140,72 @@ async def test_delete_async(async_index: AsyncIndex, ns: str):
     assert res[0] is None
     assert res[1] is None
     assert res[2] is not None
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_delete_many_ids(index: Index, ns: str):
+    ids = [f"delete-many-id{i}" for i in range(ID_BATCH_SIZE + 10)]
+
+    index.upsert(
+        vectors=[(id, [0.1, 0.2]) for id in ids],
+        namespace=ns,
+    )
+
+    del_res = index.delete(ids=ids, namespace=ns)
+    assert del_res.deleted == len(ids)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_delete_many_ids_async(async_index: AsyncIndex, ns: str):
+    ids = [f"delete-many-id{i}" for i in range(ID_BATCH_SIZE + 10)]
+
+    await async_index.upsert(
+        vectors=[(id, [0.1, 0.2]) for id in ids],
+        namespace=ns,
+    )
+
+    del_res = await async_index.delete(ids=ids, namespace=ns)
+    assert del_res.deleted == len(ids)
+
+
+def delete_response(payload):
+    return {"deleted": len(payload)}
+
+
+def test_delete_many_ids_failure_invalidates_caches():
+    with FailingIndex(
+        "http://localhost",
+        "token",
+        query_cache=QueryCache(),
+        response=delete_response,
+    ) as idx:
+        assert idx._query_cache is not None
+        idx.query([0.1, 0.2])
+        assert len(idx._query_cache) == 1
+
+        with raises(UpstashError):
+            idx.delete([f"id-{i}" for i in range(3 * ID_BATCH_SIZE)])
+
+        assert len(idx._query_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_many_ids_failure_invalidates_caches_async():
+    async with FailingAsyncIndex(
+        "http://localhost",
+        "token",
+        query_cache=QueryCache(),
+        response=delete_response,
+    ) as idx:
+        assert idx._query_cache is not None
+        await idx.query([0.1, 0.2])
+        assert len(idx._query_cache) == 1
+
+        with raises(UpstashError):
+            await idx.delete(
+                [f"id-{i}" for i in range(3 * ID_BATCH_SIZE)], max_concurrency=1
+            )
+
+        assert len(idx._query_cache) == 0
+        assert idx.requests == 3
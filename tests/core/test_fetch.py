@@ -1,7 +1,11 @@
+import asyncio
+from os import environ
+
 import pytest
 
 from tests import NAMESPACES
 from upstash_vector import Index, AsyncIndex
+from upstash_vector.core.index_operations import ID_BATCH_SIZE
 
 
 @pytest.mark.parametrize("ns", NAMESPACES)
@@ -378,3 +382,166 @@ async def test_fetch_with_data_async(async_index: AsyncIndex, ns: str):
     assert res[2].metadata is None
     assert res[2].vector == v3_values
     assert res[2].data == v3_data
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_fetch_many_ids(index: Index, ns: str):
+    ids = [f"many-id{i}" for i in range(ID_BATCH_SIZE + 10)]
+
+    index.upsert(
+        vectors=[(id, [0.1, 0.2]) for id in ids],
+        namespace=ns,
+    )
+
+    res = index.fetch(ids=ids + ["non-existing-id"], namespace=ns)
+
+    assert len(res) == len(ids) + 1
+    for id, vector in zip(ids, res):
+        assert vector is not None
+        assert vector.id == id
+
+    assert res[-1] is None
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_fetch_iterable_ids(index: Index, ns: str):
+    index.upsert(
+        vectors=[
+            ("id1", [0.1, 0.2]),
+            ("id2", [0.3, 0.4]),
+        ],
+        namespace=ns,
+    )
+
+    res = index.fetch(ids=("id1", "id2"), namespace=ns)
+    assert [vector.id for vector in res if vector] == ["id1", "id2"]
+
+    res = index.fetch(ids=(id for id in ["id2", "id1"]), namespace=ns)
+    assert [vector.id for vector in res if vector] == ["id2", "id1"]
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_fetch_duplicate_ids(index: Index, ns: str):
+    index.upsert(
+        vectors=[
+            ("id1", [0.1, 0.2]),
+            ("id2", [0.3, 0.4]),
+        ],
+        namespace=ns,
+    )
+
+    res = index.fetch(ids=["id1", "id2", "id1", "id3", "id2"], namespace=ns)
+    assert [vector.id if vector else None for vector in res] == [
+        "id1",
+        "id2",
+        "id1",
+        None,
+        "id2",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_fetch_duplicate_ids_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        vectors=[
+            ("id1", [0.1, 0.2]),
+            ("id2", [0.3, 0.4]),
+        ],
+        namespace=ns,
+    )
+
+    res = await async_index.fetch(ids=["id1", "id2", "id1", "id3", "id2"], namespace=ns)
+    assert [vector.id if vector else None for vector in res] == [
+        "id1",
+        "id2",
+        "id1",
+        None,
+        "id2",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_fetch_many_ids_async(async_index: AsyncIndex, ns: str):
+    ids = [f"many-id{i}" for i in range(ID_BATCH_SIZE + 10)]
+
+    await async_index.upsert(
+        vectors=[(id, [0.1, 0.2]) for id in ids],
+        namespace=ns,
+    )
+
+    res = await async_index.fetch(ids=ids + ["non-existing-id"], namespace=ns)
+
+    assert len(res) == len(ids) + 1
+    for id, vector in zip(ids, res):
+        assert vector is not None
+        assert vector.id == id
+
+    assert res[-1] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_fetch_many_ids_max_concurrency_async(async_index: AsyncIndex, ns: str):
+    ids = [f"many-id{i}" for i in range(2 * ID_BATCH_SIZE + 10)]
+
+    await async_index.upsert(
+        vectors=[(id, [0.1, 0.2]) for id in ids],
+        namespace=ns,
+    )
+
+    res = await async_index.fetch(ids=ids, namespace=ns, max_concurrency=1)
+
+    assert len(res) == len(ids)
+    for id, vector in zip(ids, res):
+        assert vector is not None
+        assert vector.id == id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_fetch_coalescing_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        vectors=[
+            ("id1", [0.1, 0.2]),
+            ("id2", [0.3, 0.4]),
+        ],
+        namespace=ns,
+    )
+
+    async with AsyncIndex(
+        environ["URL"], environ["TOKEN"], fetch_coalescing_window=0.01
+    ) as coalescing_index:
+        res1, res2, res3 = await asyncio.gather(
+            coalescing_index.fetch("id1", namespace=ns),
+            coalescing_index.fetch(["id2", "id1"], namespace=ns),
+            coalescing_index.fetch(["non-existing-id"], namespace=ns),
+        )
+
+    assert [vector.id for vector in res1 if vector] == ["id1"]
+    assert [vector.id for vector in res2 if vector] == ["id2", "id1"]
+    assert res3 == [None]
+
+
+@pytest.mark.asyncio
+async def test_fetch_coalescing_max_concurrency_async():
+    class CountingAsyncIndex(AsyncIndex):
+        active = 0
+        max_active = 0
+
+        async def _execute_request_async(self, payload="", path=""):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return [{"id": id, "score": 1.0} for id in payload["ids"]]
+
+    ids = [f"id-{i}" for i in range(3 * ID_BATCH_SIZE)]
+    async with CountingAsyncIndex(
+        "http://localhost", "token", fetch_coalescing_window=0.01
+    ) as idx:
+        res = await idx.fetch(ids, max_concurrency=1)
+
+        assert [vector.id for vector in res if vector] == ids
+        assert idx.max_active == 1
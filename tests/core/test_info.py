@@ -1,3 +1,6 @@
+import asyncio
+from os import environ
+
 import pytest
 
 from tests import (
@@ -67,3 +70,86 @@ async def test_info_async(async_index: AsyncIndex):
             assert i.namespaces[ns].vector_count == 1
 
     await assert_eventually_async(assertion)
+
+
+def test_info_ttl(index: Index):
+    with Index(environ["URL"], environ["TOKEN"], info_ttl=60) as cached_index:
+        info = cached_index.info()
+        assert cached_index.info() is info
+
+        cached_index.upsert([{"id": "foo", "vector": [0, 1]}])
+        assert cached_index._info_cache is None
+
+        def assertion():
+            cached_index._info_cache = None
+            assert cached_index.info().vector_count == 1
+
+        assert_eventually(assertion)
+
+
+@pytest.mark.asyncio
+async def test_info_ttl_async(async_index: AsyncIndex):
+    async with AsyncIndex(
+        environ["URL"], environ["TOKEN"], info_ttl=60
+    ) as cached_index:
+        info = await cached_index.info()
+        assert await cached_index.info() is info
+
+        await cached_index.upsert([{"id": "foo", "vector": [0, 1]}])
+        assert cached_index._info_cache is None
+
+        async def assertion():
+            cached_index._info_cache = None
+            assert (await cached_index.info()).vector_count == 1
+
+        await assert_eventually_async(assertion)
+
+
+INFO_RESPONSE = {
+    "vectorCount": 0,
+    "pendingVectorCount": 0,
+    "indexSize": 0,
+    "dimension": 2,
+    "similarityFunction": "COSINE",
+    "namespaces": {"": {"vectorCount": 0, "pendingVectorCount": 0}},
+}
+
+
+def test_info_ttl_in_flight_during_write():
+    class WritingIndex(Index):
+        # simulates a write made through the client while the info is in flight
+        def _execute_request(self, payload="", path=""):
+            if path.startswith("/info"):
+                self._invalidate_caches("")
+                return INFO_RESPONSE
+
+            return "Success"
+
+    with WritingIndex("http://localhost", "token", info_ttl=60) as idx:
+        idx.info()
+        assert idx._info_cache is None
+
+
+@pytest.mark.asyncio
+async def test_info_ttl_in_flight_during_write_async():
+    class SlowInfoAsyncIndex(AsyncIndex):
+        info_requested = asyncio.Event()
+        info_released = asyncio.Event()
+
+        async def _execute_request_async(self, payload="", path=""):
+            if path.startswith("/info"):
+                self.info_requested.set()
+                await self.info_released.wait()
+                return INFO_RESPONSE
+
+            return "Success"
+
+    async with SlowInfoAsyncIndex("http://localhost", "token", info_ttl=60) as idx:
+        info = asyncio.ensure_future(idx.info())
+        await idx.info_requested.wait()
+
+        await idx.upsert([("id-0", [0.1, 0.2])])
+        idx.info_released.set()
+        await info
+
+        assert idx._info_cache is None
@@ -1,3 +1,6 @@
+import asyncio
+from os import environ
+
 import pytest
 
 from tests import NAMESPACES, ensure_ns_exists, ensure_ns_exists_async
@@ -61,3 +64,75 @@ async def test_delete_namespaces_async(async_index: AsyncIndex):
 
     # Only default namespace should exist
     assert len(info.namespaces) == 1
+
+
+def test_list_namespaces_ttl(index: Index):
+    with Index(environ["URL"], environ["TOKEN"], info_ttl=60) as cached_index:
+        all_ns = cached_index.list_namespaces()
+        assert cached_index.list_namespaces() == all_ns
+        assert cached_index._namespaces_cache is not None
+
+        cached_index.upsert([{"id": "foo", "vector": [0, 1]}], namespace="ns-ttl")
+        assert cached_index._namespaces_cache is None
+        assert "ns-ttl" in cached_index.list_namespaces()
+
+
+@pytest.mark.asyncio
+async def test_list_namespaces_ttl_async(async_index: AsyncIndex):
+    async with AsyncIndex(
+        environ["URL"], environ["TOKEN"], info_ttl=60
+    ) as cached_index:
+        all_ns = await cached_index.list_namespaces()
+        assert await cached_index.list_namespaces() == all_ns
+        assert cached_index._namespaces_cache is not None
+
+        await cached_index.upsert([{"id": "foo", "vector": [0, 1]}], namespace="ns-ttl")
+        assert cached_index._namespaces_cache is None
+        assert "ns-ttl" in await cached_index.list_namespaces()
+
+
+def test_list_namespaces_ttl_in_flight_during_write():
+    class WritingIndex(Index):
+        namespaces = [DEFAULT_NAMESPACE]
+
+        # simulates a write made through the client while the list is in flight
+        def _execute_request(self, payload="", path=""):
+            if path.startswith("/list-namespaces"):
+                result = list(self.namespaces)
+                self.namespaces.append("new")
+                self._invalidate_caches("new")
+                return result
+
+            return "Success"
+
+    with WritingIndex("http://localhost", "token", info_ttl=60) as idx:
+        assert idx.list_namespaces() == [DEFAULT_NAMESPACE]
+        assert idx.list_namespaces() == [DEFAULT_NAMESPACE, "new"]
+
+
+@pytest.mark.asyncio
+async def test_list_namespaces_ttl_in_flight_during_write_async():
+    class SlowListAsyncIndex(AsyncIndex):
+        namespaces = [DEFAULT_NAMESPACE]
+        list_requested = asyncio.Event()
+        list_released = asyncio.Event()
+
+        async def _execute_request_async(self, payload="", path=""):
+            if path.startswith("/list-namespaces"):
+                result = list(self.namespaces)
+                self.list_requested.set()
+                await self.list_released.wait()
+                return result
+
+            self.namespaces.append("new")
+            return "Success"
+
+    async with SlowListAsyncIndex("http://localhost", "token", info_ttl=60) as idx:
+        listing = asyncio.ensure_future(idx.list_namespaces())
+        await idx.list_requested.wait()
+
+        await idx.upsert([("id-0", [0.1, 0.2])], namespace="new")
+        idx.list_released.set()
+        assert await listing == [DEFAULT_NAMESPACE]
+
+        assert await idx.list_namespaces() == [DEFAULT_NAMESPACE, "new"]
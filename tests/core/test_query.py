@@ -1,3 +1,5 @@
+import asyncio
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -363,6 +365,61 @@ def test_query_many(index: Index, ns: str):
     assert_eventually(assertion)
 
 
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_query_normalize(index: Index, ns: str):
+    index.upsert(
+        vectors=[
+            ("id0", [0.6, 0.8]),
+            ("id1", [0.8, 0.6]),
+        ],
+        namespace=ns,
+    )
+
+    def assertion():
+        res = index.query([3, 4], top_k=2, normalize=True, namespace=ns)
+
+        assert len(res) == 2
+        assert res[0].id == "id0"
+
+    assert_eventually(assertion)
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_query_many_parallel(index: Index, ns: str):
+    index.upsert(
+        vectors=[
+            ("id0", [0.1, 0.1], {"0": 0}),
+            ("id1", [1, 1], {"1": 1}),
+            ("id2", [2, 2], {"2": 2}),
+        ],
+        namespace=ns,
+    )
+
+    def assertion():
+        res = index.query_many(
+            queries=[
+                {
+                    "vector": [1, 1],
+                },
+                {
+                    "vector": [2, 2],
+                    "top_k": 1,
+                    "include_vectors": True,
+                },
+            ],
+            namespace=ns,
+            parallel=True,
+        )
+
+        assert len(res) == 2
+        assert len(res[0]) == 3
+
+        assert len(res[1]) == 1
+        assert res[1][0].vector is not None
+
+    assert_eventually(assertion)
+
+
 @pytest.mark.parametrize("ns", NAMESPACES)
 def test_query_with_data_with_vector_with_metadata(index: Index, ns: str):
     v1_id = "id1"
@@ -967,6 +1024,113 @@ async def test_query_many_async(async_index: AsyncIndex, ns: str):
     await assert_eventually_async(assertion)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_query_normalize_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        vectors=[
+            ("id0", [0.6, 0.8]),
+            ("id1", [0.8, 0.6]),
+        ],
+        namespace=ns,
+    )
+
+    async def assertion():
+        res = await async_index.query([3, 4], top_k=2, normalize=True, namespace=ns)
+
+        assert len(res) == 2
+        assert res[0].id == "id0"
+
+    await assert_eventually_async(assertion)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_query_concurrent_identical_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        vectors=[
+            ("id0", [0.1, 0.1]),
+            ("id1", [1, 0.1]),
+        ],
+        namespace=ns,
+    )
+
+    async def assertion():
+        res = await asyncio.gather(
+            *[async_index.query([0.1, 0.1], top_k=2, namespace=ns) for _ in range(5)]
+        )
+
+        for query_res in res:
+            assert len(query_res) == 2
+            assert query_res == res[0]
+
+        assert not async_index._inflight_queries
+
+    await assert_eventually_async(assertion)
+
+
+@pytest.mark.asyncio
+async def test_query_concurrent_identical_first_cancelled_async():
+    class SlowQueryAsyncIndex(AsyncIndex):
+        requests = 0
+
+        async def _execute_request_async(self, payload="", path=""):
+            self.requests += 1
+            await asyncio.sleep(0.01)
+            return [{"id": "id-0", "score": 1.0}]
+
+    async with SlowQueryAsyncIndex("http://localhost", "token") as idx:
+        first = asyncio.ensure_future(idx.query([0.1, 0.1]))
+        await asyncio.sleep(0)
+
+        others = asyncio.gather(*[idx.query([0.1, 0.1]) for _ in range(3)])
+        await asyncio.sleep(0)
+        first.cancel()
+
+        res = await others
+        assert [query_res[0].id for query_res in res] == ["id-0"] * 3
+        assert idx.requests == 2
+        assert first.cancelled()
+        assert not idx._inflight_queries
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_query_many_parallel_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        vectors=[
+            ("id0", [0.1, 0.1], {"0": 0}),
+            ("id1", [1, 1], {"1": 1}),
+            ("id2", [2, 2], {"2": 2}),
+        ],
+        namespace=ns,
+    )
+
+    async def assertion():
+        res = await async_index.query_many(
+            queries=[
+                {
+                    "vector": [1, 1],
+                },
+                {
+                    "vector": [2, 2],
+                    "top_k": 1,
+                    "include_vectors": True,
+                },
+            ],
+            namespace=ns,
+            parallel=True,
+        )
+
+        assert len(res) == 2
+        assert len(res[0]) == 3
+
+        assert len(res[1]) == 1
+        assert res[1][0].vector is not None
+
+    await assert_eventually_async(assertion)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("ns", NAMESPACES)
 async def test_query_with_data_with_vector_with_metadata_async(
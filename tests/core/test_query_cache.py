@@ -0,0 +1,309 @@
+import time
+from os import environ
+from typing import Any, Dict
+
+import pytest
+
+from tests import assert_eventually, assert_eventually_async, NAMESPACES
+from upstash_vector import Index, AsyncIndex, QueryCache
+from upstash_vector.types import QueryResult
+
+
+def query_payload(vector: Any, top_k: int = 2, filter: str = "") -> Dict[str, Any]:
+    return {
+        "vector": vector,
+        "topK": top_k,
+        "includeVectors": False,
+        "includeMetadata": False,
+        "includeData": False,
+        "filter": filter,
+    }
+
+
+def query_results(*ids: str):
+    return [QueryResult(id=id, score=1.0) for id in ids]
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_query_cache(index: Index, ns: str):
+    with Index(
+        environ["URL"], environ["TOKEN"], query_cache=QueryCache()
+    ) as cached_index:
+        assert cached_index._query_cache is not None
+
+        index.upsert(
+            vectors=[
+                ("id1", [0.1, 0.2]),
+                ("id2", [0.3, 0.4]),
+            ],
+            namespace=ns,
+        )
+
+        def assertion():
+            res = index.query([0.1, 0.2], top_k=2, namespace=ns)
+            assert len(res) == 2
+
+        assert_eventually(assertion)
+
+        res = cached_index.query([0.1, 0.2], top_k=2, namespace=ns)
+        assert len(res) == 2
+        assert res[0].id == "id1"
+        assert len(cached_index._query_cache) == 1
+
+        cached_res = cached_index.query([0.1, 0.2], top_k=2, namespace=ns)
+        assert cached_res == res
+
+        cached_index.delete("id1", namespace=ns)
+        assert len(cached_index._query_cache) == 0
+
+        def assertion_after_delete():
+            res = index.query([0.1, 0.2], top_k=2, namespace=ns)
+            assert len(res) == 1
+
+        assert_eventually(assertion_after_delete)
+
+        res = cached_index.query([0.1, 0.2], top_k=2, namespace=ns)
+        assert len(res) == 1
+        assert res[0].id == "id2"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_query_cache_async(async_index: AsyncIndex, ns: str):
+    async with AsyncIndex(
+        environ["URL"], environ["TOKEN"], query_cache=QueryCache()
+    ) as cached_index:
+        assert cached_index._query_cache is not None
+
+        await async_index.upsert(
+            vectors=[
+                ("id1", [0.1, 0.2]),
+                ("id2", [0.3, 0.4]),
+            ],
+            namespace=ns,
+        )
+
+        async def assertion():
+            res = await async_index.query([0.1, 0.2], top_k=2, namespace=ns)
+            assert len(res) == 2
+
+        await assert_eventually_async(assertion)
+
+        res = await cached_index.query([0.1, 0.2], top_k=2, namespace=ns)
+        assert len(res) == 2
+        assert res[0].id == "id1"
+        assert len(cached_index._query_cache) == 1
+
+        cached_res = await cached_index.query([0.1, 0.2], top_k=2, namespace=ns)
+        assert cached_res == res
+
+        await cached_index.delete("id1", namespace=ns)
+        assert len(cached_index._query_cache) == 0
+
+        async def assertion_after_delete():
+            res = await async_index.query([0.1, 0.2], top_k=2, namespace=ns)
+            assert len(res) == 1
+
+        await assert_eventually_async(assertion_after_delete)
+
+        res = await cached_index.query([0.1, 0.2], top_k=2, namespace=ns)
+        assert len(res) == 1
+        assert res[0].id == "id2"
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_query_many_cache(index: Index, ns: str):
+    with Index(
+        environ["URL"], environ["TOKEN"], query_cache=QueryCache()
+    ) as cached_index:
+        assert cached_index._query_cache is not None
+
+        index.upsert(
+            vectors=[
+                ("id1", [0.1, 0.2]),
+                ("id2", [0.3, 0.4]),
+            ],
+            namespace=ns,
+        )
+
+        def assertion():
+            res = index.query([0.1, 0.2], top_k=2, namespace=ns)
+            assert len(res) == 2
+
+        assert_eventually(assertion)
+
+        cached_index.query([0.1, 0.2], top_k=1, namespace=ns)
+        assert len(cached_index._query_cache) == 1
+
+        res = cached_index.query_many(
+            queries=[
+                {"vector": [0.1, 0.2], "top_k": 1},
+                {"vector": [0.3, 0.4], "top_k": 1},
+                {"vector": [0.3, 0.4], "top_k": 2},
+            ],
+            namespace=ns,
+        )
+        assert len(cached_index._query_cache) == 2
+
+        assert len(res) == 3
+        assert res[0][0].id == "id1"
+        assert res[1][0].id == "id2"
+        assert len(res[2]) == 2
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_query_cache_smaller_top_k(index: Index, ns: str):
+    with Index(
+        environ["URL"], environ["TOKEN"], query_cache=QueryCache()
+    ) as cached_index:
+        assert cached_index._query_cache is not None
+
+        index.upsert(
+            vectors=[
+                ("id1", [0.1, 0.2]),
+                ("id2", [0.3, 0.4]),
+            ],
+            namespace=ns,
+        )
+
+        def assertion():
+            res = index.query([0.1, 0.2], top_k=2, namespace=ns)
+            assert len(res) == 2
+
+        assert_eventually(assertion)
+
+        res = cached_index.query([0.1, 0.2], top_k=2, namespace=ns)
+        assert len(res) == 2
+
+        cached_res = cached_index.query([0.1, 0.2], top_k=1, namespace=ns)
+        assert cached_res == res[:1]
+        assert len(cached_index._query_cache) == 1
+
+
+def test_query_cache_skips_results_of_invalidated_generation():
+    cache = QueryCache()
+    payload = query_payload([0.1, 0.2])
+
+    generation = cache.generation
+    cache.invalidate("")
+    cache.update("", payload, query_results("id1"), generation)
+    assert cache.get("", payload) is None
+    assert len(cache) == 0
+
+    cache.update("", payload, query_results("id1"), cache.generation)
+    assert cache.get("", payload) == query_results("id1")
+
+
+def test_query_cache_in_flight_query_during_write():
+    class WritingIndex(Index):
+        # simulates a write made through the client while a query is in flight
+        def _execute_request(self, payload: Any = "", path: str = ""):
+            if path.startswith("/query"):
+                self._invalidate_caches("")
+                return [{"id": "stale", "score": 1.0}]
+
+            return "Success"
+
+    with WritingIndex("http://localhost", "token", query_cache=QueryCache()) as idx:
+        assert idx._query_cache is not None
+
+        res = idx.query([0.1, 0.2], top_k=2)
+        assert res[0].id == "stale"
+        assert len(idx._query_cache) == 0
+
+
+def test_query_cache_ttl():
+    cache = QueryCache(ttl=0.05)
+    payload = query_payload([0.1, 0.2])
+
+    cache.update("", payload, query_results("id1"))
+    assert cache.get("", payload) == query_results("id1")
+
+    time.sleep(0.1)
+    assert cache.get("", payload) is None
+    assert len(cache) == 0
+
+
+def test_query_cache_similar_vector():
+    cache = QueryCache(d_thresh=0.05)
+    cache.update("", query_payload([1.0, 0.0]), query_results("id1"))
+
+    assert cache.get("", query_payload([1.0, 0.01])) == query_results("id1")
+    assert cache.get("", query_payload([0.0, 1.0])) is None
+
+
+def test_query_cache_similarity_threshold():
+    # the cosine distance between the vectors is 1 - 1 / sqrt(2) ~= 0.2929
+    below = QueryCache(d_thresh=0.29)
+    above = QueryCache(d_thresh=0.3)
+    for cache in (below, above):
+        cache.update("", query_payload([1.0, 0.0]), query_results("id1"))
+
+    assert below.get("", query_payload([1.0, 1.0])) is None
+    assert above.get("", query_payload([1.0, 1.0])) == query_results("id1")
+
+
+def test_query_cache_similarity_is_masked_by_params():
+    cache = QueryCache(d_thresh=0.05)
+    cache.update("", query_payload([1.0, 0.0]), query_results("id1"))
+
+    assert cache.get("ns", query_payload([1.0, 0.01])) is None
+    assert cache.get("", query_payload([1.0, 0.01], filter="a = 1")) is None
+
+    payload = query_payload([1.0, 0.01])
+    payload["includeMetadata"] = True
+    assert cache.get("", payload) is None
+
+
+def test_query_cache_similarity_is_masked_by_top_k():
+    cache = QueryCache(d_thresh=0.05)
+    cache.update("", query_payload([1.0, 0.0], top_k=1), query_results("id1"))
+
+    assert cache.get("", query_payload([1.0, 0.01], top_k=2)) is None
+    assert cache.get("", query_payload([1.0, 0.01], top_k=1)) == query_results("id1")
+
+    cache.update("", query_payload([1.0, 0.0], top_k=2), query_results("id1", "id2"))
+    assert cache.get("", query_payload([1.0, 0.01], top_k=2)) == query_results(
+        "id1", "id2"
+    )
+
+
+def test_query_cache_similarity_eviction():
+    cache = QueryCache(n=2, d_thresh=0.05)
+    cache.update("", query_payload([1.0, 0.0]), query_results("id1"))
+    cache.update("", query_payload([0.0, 1.0]), query_results("id2"))
+
+    # evicts the least recently used one, and reuses its slot
+    cache.update("", query_payload([-1.0, 0.0]), query_results("id3"))
+    assert len(cache) == 2
+
+    assert cache.get("", query_payload([1.0, 0.01])) is None
+    assert cache.get("", query_payload([0.01, 1.0])) == query_results("id2")
+    assert cache.get("", query_payload([-1.0, 0.01])) == query_results("id3")
+
+
+def test_query_cache_similarity_dimension_mismatch():
+    cache = QueryCache(d_thresh=0.05)
+    cache.update("", query_payload([1.0, 0.0]), query_results("id1"))
+
+    assert cache.get("", query_payload([1.0, 0.0, 0.01])) is None
+
+    # cached in the exact tier only
+    cache.update("", query_payload([1.0, 0.0, 0.0]), query_results("id2"))
+    assert cache.get("", query_payload([1.0, 0.0, 0.0])) == query_results("id2")
+    assert cache.get("", query_payload([1.0, 0.0, 0.01])) is None
+    assert cache.get("", query_payload([1.0, 0.01])) == query_results("id1")
+
+
+def test_query_cache_similarity_groups_are_released():
+    cache = QueryCache(n=4, d_thresh=0.05)
+    for i in range(16):
+        cache.update(
+            "", query_payload([1.0, 0.0], filter=f"i = {i}"), query_results("id1")
+        )
+
+    assert len(cache) == 4
+    assert len(cache._groups) == 4
+
+    cache.invalidate("")
+    assert len(cache._groups) == 0
@@ -1,5 +1,6 @@
 import random
 
+import numpy as np
 import pytest
 from pytest import raises
 
@@ -103,3 +104,133 @@ async def test_range_async(async_index: AsyncIndex, ns: str):
             include_vectors=True,
             namespace=ns,
         )
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_iter_range(index: Index, ns: str):
+    vectors = [
+        {
+            "id": f"id-{i}",
+            "vector": [random.random() for _ in range(2)],
+            "metadata": {"meta": i},
+        }
+        for i in range(20)
+    ]
+
+    index.upsert(vectors=vectors, namespace=ns)
+
+    res = list(index.iter_range(limit=6, include_metadata=True, namespace=ns))
+    assert len(res) == 20
+
+    for i in range(20):
+        assert res[i].id == f"id-{i}"
+        assert res[i].metadata == {"meta": i}
+
+    first_page = index.range(limit=6, namespace=ns)
+    rest = list(index.iter_range(limit=6, namespace=ns, cursor=first_page.next_cursor))
+    assert [vector.id for vector in first_page.vectors + rest] == [
+        vector.id for vector in res
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_iter_range_async(async_index: AsyncIndex, ns: str):
+    vectors = [
+        {
+            "id": f"id-{i}",
+            "vector": [random.random() for _ in range(2)],
+            "metadata": {"meta": i},
+        }
+        for i in range(20)
+    ]
+
+    await async_index.upsert(vectors=vectors, namespace=ns)
+
+    res = [
+        vector
+        async for vector in async_index.iter_range(
+            limit=6, include_metadata=True, namespace=ns
+        )
+    ]
+    assert len(res) == 20
+
+    for i in range(20):
+        assert res[i].id == f"id-{i}"
+        assert res[i].metadata == {"meta": i}
+
+    first_page = await async_index.range(limit=6, namespace=ns)
+    rest = [
+        vector
+        async for vector in async_index.iter_range(
+            limit=6, namespace=ns, cursor=first_page.next_cursor, prefetch=False
+        )
+    ]
+    assert [vector.id for vector in first_page.vectors + rest] == [
+        vector.id for vector in res
+    ]
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_range_columnar(index: Index, ns: str):
+    vectors = [
+        {
+            "id": f"id-{i}",
+            "vector": [random.random() for _ in range(2)],
+            "metadata": {"meta": i},
+        }
+        for i in range(10)
+    ]
+
+    index.upsert(vectors=vectors, namespace=ns)
+
+    res = index.range_columnar(
+        cursor="",
+        limit=4,
+        include_vectors=True,
+        include_metadata=True,
+        namespace=ns,
+    )
+    assert res.next_cursor != ""
+    assert res.ids == [f"id-{i}" for i in range(4)]
+    assert res.metadata == [{"meta": i} for i in range(4)]
+    assert res.data is None
+
+    assert res.vectors is not None
+    assert res.vectors.dtype == np.float32
+    assert res.vectors.shape == (4, 2)
+    expected = np.array([v["vector"] for v in vectors[:4]], dtype=np.float32)
+    assert np.allclose(res.vectors, expected)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_range_columnar_async(async_index: AsyncIndex, ns: str):
+    vectors = [
+        {
+            "id": f"id-{i}",
+            "vector": [random.random() for _ in range(2)],
+            "metadata": {"meta": i},
+        }
+        for i in range(10)
+    ]
+
+    await async_index.upsert(vectors=vectors, namespace=ns)
+
+    res = await async_index.range_columnar(
+        cursor="",
+        limit=4,
+        include_vectors=True,
+        include_metadata=True,
+        namespace=ns,
+    )
+    assert res.next_cursor != ""
+    assert res.ids == [f"id-{i}" for i in range(4)]
+    assert res.metadata == [{"meta": i} for i in range(4)]
+    assert res.data is None
+
+    assert res.vectors is not None
+    assert res.vectors.dtype == np.float32
+    assert res.vectors.shape == (4, 2)
+    expected = np.array([v["vector"] for v in vectors[:4]], dtype=np.float32)
+    assert np.allclose(res.vectors, expected)
@@ -1,7 +1,10 @@
+import numpy as np
 import pytest
+from pytest import raises
 
 from tests import NAMESPACES
 from upstash_vector import Index, AsyncIndex
+from upstash_vector.errors import BackgroundWriteError, UpstashError
 from upstash_vector.types import MetadataUpdateMode
 
 
@@ -26,6 +29,38 @@ def test_update_vector(index: Index, ns: str):
     assert res[0].vector == [0.2, 0.3]
 
 
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_update_vector_numpy(index: Index, ns: str):
+    index.upsert(
+        [("id-0", [0.1, 0.2])],
+        namespace=ns,
+    )
+
+    updated = index.update("id-0", vector=np.array([0.2, 0.3]), namespace=ns)
+    assert updated is True
+
+    res = index.fetch("id-0", include_vectors=True, namespace=ns)
+    assert len(res) == 1
+    assert res[0] is not None
+    assert res[0].vector == [0.2, 0.3]
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_update_vector_tuple(index: Index, ns: str):
+    index.upsert(
+        [("id-0", [0.1, 0.2])],
+        namespace=ns,
+    )
+
+    updated = index.update("id-0", vector=(0.2, 0.3), namespace=ns)
+    assert updated is True
+
+    res = index.fetch("id-0", include_vectors=True, namespace=ns)
+    assert len(res) == 1
+    assert res[0] is not None
+    assert res[0].vector == [0.2, 0.3]
+
+
 @pytest.mark.parametrize("ns", NAMESPACES)
 def test_update_data(embedding_index: Index, ns: str):
     embedding_index.upsert(
@@ -128,6 +163,39 @@ def test_update_non_existing_id(index: Index, ns: str):
     assert updated is False
 
 
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_update_many(index: Index, ns: str):
+    index.upsert(
+        [
+            ("id-0", [0.1, 0.2]),
+            ("id-1", [0.3, 0.4], {"field": "value"}),
+        ],
+        namespace=ns,
+    )
+
+    updated = index.update_many(
+        [
+            {"id": "id-0", "vector": [0.2, 0.3]},
+            {
+                "id": "id-1",
+                "metadata": {"new_field": "new_value"},
+                "metadata_update_mode": MetadataUpdateMode.PATCH,
+            },
+            {"id": "id-999", "vector": [0.4, 0.5]},
+        ],
+        namespace=ns,
+    )
+    assert updated == [True, True, False]
+
+    res = index.fetch(
+        ["id-0", "id-1"], include_vectors=True, include_metadata=True, namespace=ns
+    )
+    assert res[0] is not None
+    assert res[0].vector == [0.2, 0.3]
+    assert res[1] is not None
+    assert res[1].metadata == {"field": "value", "new_field": "new_value"}
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("ns", NAMESPACES)
 async def test_update_vector_async(async_index: AsyncIndex, ns: str):
@@ -257,3 +325,95 @@ async def test_update_vector_data_async(async_index: AsyncIndex, ns: str):
 async def test_update_non_existing_id_async(async_index: AsyncIndex, ns: str):
     updated = await async_index.update("id-999", vector=[0.4, 0.5], namespace=ns)
     assert updated is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_update_many_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        [
+            ("id-0", [0.1, 0.2]),
+            ("id-1", [0.3, 0.4], {"field": "value"}),
+        ],
+        namespace=ns,
+    )
+
+    updated = await async_index.update_many(
+        [
+            {"id": "id-0", "vector": [0.2, 0.3]},
+            {
+                "id": "id-1",
+                "metadata": {"new_field": "new_value"},
+                "metadata_update_mode": MetadataUpdateMode.PATCH,
+            },
+            {"id": "id-999", "vector": [0.4, 0.5]},
+        ],
+        namespace=ns,
+        max_concurrency=2,
+    )
+    assert updated == [True, True, False]
+
+    res = await async_index.fetch(
+        ["id-0", "id-1"], include_vectors=True, include_metadata=True, namespace=ns
+    )
+    assert res[0] is not None
+    assert res[0].vector == [0.2, 0.3]
+    assert res[1] is not None
+    assert res[1].metadata == {"field": "value", "new_field": "new_value"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_update_without_waiting_async(async_index: AsyncIndex, ns: str):
+    await async_index.upsert(
+        [(f"id-{i}", [0.1, 0.2]) for i in range(10)],
+        namespace=ns,
+    )
+
+    for i in range(10):
+        updated = await async_index.update(
+            f"id-{i}", metadata={"i": i}, namespace=ns, wait=False
+        )
+        assert updated is True
+
+    await async_index.flush_writes()
+    assert not async_index._pending_writes
+
+    res = await async_index.fetch(
+        [f"id-{i}" for i in range(10)], include_metadata=True, namespace=ns
+    )
+    for i, r in enumerate(res):
+        assert r is not None
+        assert r.metadata == {"i": i}
+
+
+class FailingUpdateAsyncIndex(AsyncIndex):
+    # fails the updates of the ids starting with "bad"
+    async def _execute_request_async(self, payload="", path=""):
+        if payload["id"].startswith("bad"):
+            raise UpstashError(f"failed {payload['id']}")
+
+        return {"updated": 1}
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_raises_all_errors_async():
+    async with FailingUpdateAsyncIndex("http://localhost", "token") as idx:
+        await idx.update("bad-0", metadata={}, wait=False)
+        with raises(UpstashError):
+            await idx.flush_writes()
+
+        for id in ["id-0", "bad-1", "bad-2"]:
+            await idx.update(id, metadata={}, wait=False)
+
+        with raises(BackgroundWriteError) as e:
+            await idx.flush_writes()
+
+        assert sorted(str(error) for error in e.value.errors) == [
+            "failed bad-1",
+            "failed bad-2",
+        ]
+        assert not idx._pending_writes
+
+        # nothing is left to be raised by the next flush
+        await idx.flush_writes()
@@ -1,9 +1,14 @@
+import asyncio
+import json
+from os import environ
+
 import pytest
 from pytest import raises
 
-from tests import NAMESPACES
-from upstash_vector import Index, AsyncIndex
-from upstash_vector.errors import ClientError
+from tests import NAMESPACES, FailingIndex, FailingAsyncIndex
+from upstash_vector import Index, AsyncIndex, QueryCache
+from upstash_vector.errors import ClientError, UpstashError
+from upstash_vector.http import dumps
 from upstash_vector.types import Data, Vector
 
 import numpy as np
@@ -766,3 +771,177 @@ async def test_invalid_payload_async(async_index: AsyncIndex, ns: str):
             ],
             namespace=ns,
         )
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_in_batches(index: Index, ns: str):
+    ids = [f"batch-id{i}" for i in range(25)]
+
+    index.upsert(
+        vectors=[(id, [0.1, 0.2]) for id in ids],
+        namespace=ns,
+        batch_size=10,
+    )
+
+    res = index.fetch(ids=ids, namespace=ns)
+    assert len(res) == len(ids)
+    for id, vector in zip(ids, res):
+        assert vector is not None
+        assert vector.id == id
+
+    with raises(ClientError):
+        index.upsert(vectors=[("id1", [0.1, 0.2])], namespace=ns, batch_size=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_upsert_in_batches_async(async_index: AsyncIndex, ns: str):
+    ids = [f"batch-id{i}" for i in range(25)]
+
+    await async_index.upsert(
+        vectors=[(id, [0.1, 0.2]) for id in ids],
+        namespace=ns,
+        batch_size=10,
+        max_concurrency=2,
+    )
+
+    res = await async_index.fetch(ids=ids, namespace=ns)
+    assert len(res) == len(ids)
+    for id, vector in zip(ids, res):
+        assert vector is not None
+        assert vector.id == id
+
+    with raises(ClientError):
+        await async_index.upsert(
+            vectors=[("id1", [0.1, 0.2])], namespace=ns, batch_size=0
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_upsert_buffered_async(async_index: AsyncIndex, ns: str):
+    ids = [f"buffered-id{i}" for i in range(25)]
+
+    res = await asyncio.gather(
+        *[
+            async_index.upsert_buffered((id, [0.1, 0.2]), namespace=ns, max_batch=10)
+            for id in ids
+        ]
+    )
+    assert res == ["Success"] * len(ids)
+
+    fetched = await async_index.fetch(ids=ids, namespace=ns)
+    assert len(fetched) == len(ids)
+    for id, vector in zip(ids, fetched):
+        assert vector is not None
+        assert vector.id == id
+
+    with raises(ClientError):
+        await async_index.upsert_buffered(("id1", [0.1, 0.2]), max_batch=0)
+
+
+def test_dumps_values_rejected_by_orjson():
+    payload = {
+        "id": "id-0",
+        "vector": np.array([0.1, 0.2]),
+        "metadata": {1: "a", "big": 2**70},
+    }
+
+    assert json.loads(dumps(payload) or b"") == {
+        "id": "id-0",
+        "vector": [0.1, 0.2],
+        "metadata": {"1": "a", "big": 2**70},
+    }
+
+
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_metadata_with_non_str_keys(index: Index, ns: str):
+    index.upsert(vectors=[("id-0", [0.1, 0.2], {1: "a"})], namespace=ns)
+
+    res = index.fetch("id-0", include_metadata=True, namespace=ns)
+    assert res[0] is not None
+    assert res[0].metadata == {"1": "a"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_upsert_metadata_with_non_str_keys_async(
+    async_index: AsyncIndex, ns: str
+):
+    await async_index.upsert(vectors=[("id-0", [0.1, 0.2], {1: "a"})], namespace=ns)
+
+    res = await async_index.fetch("id-0", include_metadata=True, namespace=ns)
+    assert res[0] is not None
+    assert res[0].metadata == {"1": "a"}
+
+
+def test_upsert_in_batches_failure_invalidates_caches():
+    with FailingIndex("http://localhost", "token", query_cache=QueryCache()) as idx:
+        assert idx._query_cache is not None
+        idx.query([0.1, 0.2])
+        assert len(idx._query_cache) == 1
+
+        with raises(UpstashError):
+            idx.upsert([(f"id-{i}", [0.1, 0.2]) for i in range(3)], batch_size=1)
+
+        assert len(idx._query_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_upsert_in_batches_failure_invalidates_caches_async():
+    async with FailingAsyncIndex(
+        "http://localhost", "token", query_cache=QueryCache()
+    ) as idx:
+        assert idx._query_cache is not None
+        await idx.query([0.1, 0.2])
+        assert len(idx._query_cache) == 1
+
+        with raises(UpstashError):
+            await idx.upsert(
+                [(f"id-{i}", [0.1, 0.2]) for i in range(3)],
+                batch_size=1,
+                max_concurrency=1,
+            )
+
+        assert len(idx._query_cache) == 0
+        assert idx.requests == 3
+
+
+@pytest.mark.parametrize("compress", ["gzip", "zstd"])
+@pytest.mark.parametrize("ns", NAMESPACES)
+def test_upsert_compressed(index: Index, ns: str, compress: str):
+    ids = [f"id-{i}" for i in range(1000)]
+
+    with Index(environ["URL"], environ["TOKEN"], compress=compress) as idx:
+        # large enough to be compressed
+        idx.upsert(vectors=[(id, [0.1, 0.2]) for id in ids], namespace=ns)
+
+        res = idx.fetch(ids, include_vectors=True, namespace=ns)
+        assert len(res) == len(ids)
+        for id, vector in zip(ids, res):
+            assert vector is not None
+            assert vector.id == id
+            assert vector.vector == [0.1, 0.2]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("compress", ["gzip", "zstd"])
+@pytest.mark.parametrize("ns", NAMESPACES)
+async def test_upsert_compressed_async(async_index: AsyncIndex, ns: str, compress: str):
+    ids = [f"id-{i}" for i in range(1000)]
+
+    async with AsyncIndex(environ["URL"], environ["TOKEN"], compress=compress) as idx:
+        # large enough to be compressed
+        await idx.upsert(vectors=[(id, [0.1, 0.2]) for id in ids], namespace=ns)
+
+        res = await idx.fetch(ids, include_vectors=True, namespace=ns)
+        assert len(res) == len(ids)
+        for id, vector in zip(ids, res):
+            assert vector is not None
+            assert vector.id == id
+            assert vector.vector == [0.1, 0.2]
+
+
+def test_compress_invalid():
+    with raises(ClientError):
+        Index("http://localhost", "token", compress="br")
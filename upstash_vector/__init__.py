@@ -1,6 +1,7 @@
 __version__ = "0.6.0"
 
 from upstash_vector.client import Index, AsyncIndex
+from upstash_vector.core.query_cache import QueryCache
 from upstash_vector.types import Vector
 
-__all__ = ["Index", "AsyncIndex", "Vector"]
+__all__ = ["Index", "AsyncIndex", "QueryCache", "Vector"]
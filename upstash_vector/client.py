@@ -1,15 +1,28 @@
 from os import environ
-from typing import Any
+from typing import Any, Optional, Union
 
 import httpx
 
-from upstash_vector.core.index_operations import IndexOperations, AsyncIndexOperations
+from upstash_vector.core.index_operations import (
+    COMPRESSED_PATHS,
+    IndexOperations,
+    AsyncIndexOperations,
+)
+from upstash_vector.core.query_cache import QueryCache
 from upstash_vector.http import (
+    compression_encoding,
     execute_with_parameters,
     execute_with_parameters_async,
     generate_headers,
 )
 
+CONNECTION_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+"""
+Connection pool limits of the clients. Enough connections are kept alive
+for the concurrent requests of the batched and parallel operations to reuse
+them, instead of making new connections.
+"""
+
 
 class Index(IndexOperations):
     """
@@ -26,36 +39,102 @@ class Index(IndexOperations):
 
     # retry 5 times, waiting 100ms between consequent requests
     index = Index(url=<url>, token=<token>, retries=5, retry_interval=0.1)
+
+    # alternatively, cache the results of the queries in-process
+
+    from upstash_vector import QueryCache
+    index = Index(url=<url>, token=<token>, query_cache=QueryCache(n=1024))
+
+    # alternatively, compress large upsert request bodies with gzip,
+    # or with zstd by passing compress="zstd" (requires the `zstd` extra)
+
+    index = Index(url=<url>, token=<token>, compress=True)
+
+    # alternatively, multiplex the requests over a single HTTP/2
+    # connection (requires the `http2` extra)
+
+    index = Index(url=<url>, token=<token>, http2=True)
+
+    # alternatively, reuse the index info and the namespaces for up to 250ms
+
+    index = Index(url=<url>, token=<token>, info_ttl=0.25)
+    ```
+
+    Responses are requested compressed with the encodings the installed
+    decoders support: gzip and deflate always, brotli with the `brotli`
+    extra, and zstd with the `zstd` extra when httpx is 0.27 or later.
+
+    The client keeps its connections alive between requests. They can be
+    released with `close`, or by using the client as a context manager.
+
+    ```python
+    with Index(url=<url>, token=<token>) as index:
+        index.info()
     ```
     """
 
     def __init__(
-        self, url: str, token: str, retries: int = 3, retry_interval: float = 1.0
+        self,
+        url: str,
+        token: str,
+        retries: int = 3,
+        retry_interval: float = 1.0,
+        query_cache: Optional[QueryCache] = None,
+        compress: Union[bool, str] = False,
+        http2: bool = False,
+        info_ttl: float = 0.0,
     ):
         self._url = url
         self._client = httpx.Client(
             timeout=httpx.Timeout(
                 timeout=120.0,
                 connect=10.0,
-            )
+            ),
+            headers=generate_headers(token),
+            http2=http2,
+            limits=CONNECTION_LIMITS,
         )
         self._retries = retries
         self._retry_interval = retry_interval
-        self._headers = generate_headers(token)
+        self._query_cache = query_cache
+        self._compression = compression_encoding(compress)
+        self._info_ttl = info_ttl
+
+    def __enter__(self) -> "Index":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying HTTP connections of the client.
+        """
+        self._client.close()
 
     def _execute_request(self, payload: Any = "", path: str = ""):
         url_with_path = f"{self._url}{path}"
         return execute_with_parameters(
             url=url_with_path,
             client=self._client,
-            headers=self._headers,
             retries=self._retries,
             retry_interval=self._retry_interval,
             payload=payload,
+            compression=(
+                self._compression if path.startswith(COMPRESSED_PATHS) else None
+            ),
         )
 
     @classmethod
-    def from_env(cls, retries: int = 3, retry_interval: float = 1.0) -> "Index":
+    def from_env(
+        cls,
+        retries: int = 3,
+        retry_interval: float = 1.0,
+        query_cache: Optional[QueryCache] = None,
+        compress: Union[bool, str] = False,
+        http2: bool = False,
+        info_ttl: float = 0.0,
+    ) -> "Index":
         """
         Load the credentials from environment, and returns a client.
         """
@@ -65,6 +144,10 @@ class Index(IndexOperations):
             environ["UPSTASH_VECTOR_REST_TOKEN"],
             retries,
             retry_interval,
+            query_cache=query_cache,
+            compress=compress,
+            http2=http2,
+            info_ttl=info_ttl,
         )
 
 
@@ -83,6 +166,42 @@ class AsyncIndex(AsyncIndexOperations):
 
     # retry 5 times, waiting 100ms between consequent requests
     index = AsyncIndex(url=<url>, token=<token>, retries=5, retry_interval=0.1)
+
+    # alternatively, cache the results of the queries in-process
+
+    from upstash_vector import QueryCache
+    index = AsyncIndex(url=<url>, token=<token>, query_cache=QueryCache(n=1024))
+
+    # alternatively, compress large upsert request bodies with gzip,
+    # or with zstd by passing compress="zstd" (requires the `zstd` extra)
+
+    index = AsyncIndex(url=<url>, token=<token>, compress=True)
+
+    # alternatively, multiplex the requests over a single HTTP/2
+    # connection (requires the `http2` extra)
+
+    index = AsyncIndex(url=<url>, token=<token>, http2=True)
+
+    # alternatively, reuse the index info and the namespaces for up to 250ms
+
+    index = AsyncIndex(url=<url>, token=<token>, info_ttl=0.25)
+
+    # alternatively, send the fetches made within 1ms of each
+    # other in a single request
+
+    index = AsyncIndex(url=<url>, token=<token>, fetch_coalescing_window=0.001)
+    ```
+
+    Responses are requested compressed with the encodings the installed
+    decoders support: gzip and deflate always, brotli with the `brotli`
+    extra, and zstd with the `zstd` extra when httpx is 0.27 or later.
+
+    The client keeps its connections alive between requests. They can be
+    released with `close`, or by using the client as an async context manager.
+
+    ```python
+    async with AsyncIndex(url=<url>, token=<token>) as index:
+        await index.info()
     ```
     """
 
@@ -92,31 +211,71 @@ class AsyncIndex(AsyncIndexOperations):
         token: str,
         retries: int = 3,
         retry_interval: float = 1.0,
+        query_cache: Optional[QueryCache] = None,
+        compress: Union[bool, str] = False,
+        http2: bool = False,
+        info_ttl: float = 0.0,
+        fetch_coalescing_window: float = 0.0,
     ):
         self._url = url
-        self._headers = generate_headers(token)
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(
                 timeout=120.0,
                 connect=10.0,
-            )
+            ),
+            headers=generate_headers(token),
+            http2=http2,
+            limits=CONNECTION_LIMITS,
         )
         self._retries = retries
         self._retry_interval = retry_interval
+        self._query_cache = query_cache
+        self._compression = compression_encoding(compress)
+        self._info_ttl = info_ttl
+        self._fetch_coalescing_window = fetch_coalescing_window
+
+    async def __aenter__(self) -> "AsyncIndex":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Sends the buffered upserts and fetches, if there are any, waits for
+        the writes made with `wait=False`, and closes the underlying HTTP
+        connections of the client.
+        """
+        try:
+            await self.flush_writes()
+            await self._flush_fetches()
+        finally:
+            await self._client.aclose()
 
     async def _execute_request_async(self, payload: Any = "", path: str = ""):
         url_with_path = f"{self._url}{path}"
         return await execute_with_parameters_async(
             client=self._client,
             url=url_with_path,
-            headers=self._headers,
             retries=self._retries,
             retry_interval=self._retry_interval,
             payload=payload,
+            compression=(
+                self._compression if path.startswith(COMPRESSED_PATHS) else None
+            ),
         )
 
     @classmethod
-    def from_env(cls, retries: int = 3, retry_interval: float = 1.0) -> "AsyncIndex":
+    def from_env(
+        cls,
+        retries: int = 3,
+        retry_interval: float = 1.0,
+        query_cache: Optional[QueryCache] = None,
+        compress: Union[bool, str] = False,
+        http2: bool = False,
+        info_ttl: float = 0.0,
+        fetch_coalescing_window: float = 0.0,
+    ) -> "AsyncIndex":
         """
         Load the credentials from environment, and returns a client.
         """
@@ -126,4 +285,9 @@ class AsyncIndex(AsyncIndexOperations):
             environ["UPSTASH_VECTOR_REST_TOKEN"],
             retries,
             retry_interval,
+            query_cache=query_cache,
+            compress=compress,
+            http2=http2,
+            info_ttl=info_ttl,
+            fetch_coalescing_window=fetch_coalescing_window,
         )
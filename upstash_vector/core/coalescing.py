@@ -0,0 +1,149 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from upstash_vector.types import FetchResult
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Coalescer(Generic[T, R]):
+    """
+    Accumulates the items of the concurrent calls, and sends them together.
+
+    A batch is sent when it reaches `max_size` in total, or `flush_after`
+    seconds after its first item is added, whichever happens first.
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[Tuple[T, "asyncio.Future[R]"]] = []
+        self._pending_size = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    def _add(
+        self, item: T, size: int, flush_after: float, max_size: int
+    ) -> "asyncio.Future[R]":
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        self._pending_size += size
+
+        if self._pending_size >= max_size:
+            self._send_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(flush_after, self._send_pending)
+
+        return future
+
+    async def flush(self) -> None:
+        """
+        Sends the current batch, and waits for all the sent batches.
+        """
+        self._send_pending()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _send_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        self._pending_size = 0
+        task = asyncio.ensure_future(self._send_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch: List[Tuple[T, "asyncio.Future[R]"]]) -> None:
+        try:
+            results = await self._send([item for item, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _send(self, items: List[T]) -> List[R]:
+        """
+        Sends the items, and returns the result of each of them.
+        """
+        raise NotImplementedError("send")
+
+
+class UpsertBuffer(_Coalescer[Any, str]):
+    """
+    Accumulates the vectors that are upserted one by one, and upserts
+    them together in batches.
+    """
+
+    def __init__(self, upsert: Callable[[List[Any]], Awaitable[str]]):
+        super().__init__()
+        self._upsert = upsert
+
+    def add(
+        self, vector: Any, flush_after: float, max_batch: int
+    ) -> "asyncio.Future[str]":
+        """
+        Adds the vector to the current batch, and returns a future that
+        is resolved with the result of the upsert of the batch.
+        """
+        return self._add(vector, 1, flush_after, max_batch)
+
+    async def _send(self, items: List[Any]) -> List[str]:
+        result = await self._upsert(items)
+        return [result] * len(items)
+
+
+class FetchCoalescer(_Coalescer[Sequence[str], List[Optional[FetchResult]]]):
+    """
+    Accumulates the ids of the concurrent fetches, and fetches them
+    together in a single request.
+    """
+
+    def __init__(
+        self, fetch: Callable[[List[str]], Awaitable[List[Optional[FetchResult]]]]
+    ):
+        super().__init__()
+        self._fetch = fetch
+
+    def add(
+        self, ids: Sequence[str], flush_after: float, max_ids: int
+    ) -> "asyncio.Future[List[Optional[FetchResult]]]":
+        """
+        Adds the ids to the current batch, and returns a future that
+        is resolved with the results of them, in the same order.
+        """
+        return self._add(ids, len(ids), flush_after, max_ids)
+
+    async def _send(
+        self, items: List[Sequence[str]]
+    ) -> List[List[Optional[FetchResult]]]:
+        # the same id might be fetched by multiple callers
+        unique_ids = list(dict.fromkeys(id for ids in items for id in ids))
+        results = await self._fetch(unique_ids)
+
+        by_id: Dict[str, Optional[FetchResult]] = dict(zip(unique_ids, results))
+        return [[by_id[id] for id in ids] for ids in items]
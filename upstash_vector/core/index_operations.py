@@ -1,3 +1,6 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Sequence,
     Union,
@@ -8,10 +11,17 @@ from typing import (
     Tuple,
     Callable,
     Awaitable,
+    Iterator,
+    AsyncIterator,
+    Iterable,
+    Set,
 )
 
-from upstash_vector.errors import ClientError
+from upstash_vector.core.coalescing import FetchCoalescer, UpsertBuffer
+from upstash_vector.core.query_cache import QueryCache, request_key
+from upstash_vector.errors import BackgroundWriteError, ClientError
 from upstash_vector.types import (
+    ColumnarRangeResult,
     Data,
     DeleteResult,
     MetadataUpdateMode,
@@ -21,15 +31,21 @@ from upstash_vector.types import (
     SupportsToList,
     FetchResult,
     QueryResult,
+    UpdateRequest,
     Vector,
 )
 from upstash_vector.utils import (
+    build_upsert_payload,
     convert_query_requests_to_payload,
-    convert_to_list,
-    convert_to_vectors,
-    convert_to_payload,
+    convert_to_payload_vector,
+    normalize_vector,
 )
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
 DEFAULT_NAMESPACE = ""
 
 UPSERT_PATH = "/upsert"
@@ -50,28 +66,191 @@ RESUMABLE_QUERY_DATA_PATH = "/resumable-query-data"
 RESUMABLE_QUERY_NEXT_PATH = "/resumable-query-next"
 RESUMABLE_QUERY_END_PATH = "/resumable-query-end"
 
+COMPRESSED_PATHS = (UPSERT_PATH, UPSERT_DATA_PATH)
+"""
+Prefixes of the paths whose request bodies are compressed, when the client is
+created with `compress`. Only the upserts, which carry the vectors and
+the data in bulk, tend to be large enough to benefit from it.
+"""
+
+ID_BATCH_SIZE = 1000
+"""Maximum number of ids sent in a single fetch or delete request."""
+
+ID_BATCH_MAX_CONCURRENCY = 8
+"""Default number of concurrent fetch or delete requests of the async client."""
+
+UPSERT_BATCH_SIZE = 1000
+"""Default number of vectors sent in a single upsert request."""
+
+UPSERT_MAX_CONCURRENCY = 8
+"""Default number of concurrent upsert requests of the async client."""
+
+UPDATE_MAX_CONCURRENCY = 8
+"""Default number of concurrent update requests of `update_many` of the async client."""
+
+BACKGROUND_WRITE_MAX_CONCURRENCY = 8
+"""Maximum number of concurrent requests of the writes made with `wait=False`."""
+
+UPSERT_BUFFER_FLUSH_AFTER_MS = 5
+"""Default time, in milliseconds, a buffered upsert waits for more vectors."""
+
+UPSERT_BUFFER_MAX_BATCH = 512
+"""Default maximum number of vectors in a batch of buffered upserts."""
+
+FETCH_COALESCING_MAX_IDS = ID_BATCH_SIZE
+"""Maximum number of ids of the coalesced fetches sent in a single request."""
+
+QUERY_MANY_MAX_WORKERS = 16
+"""Maximum number of threads sending the queries of a parallel `query_many`."""
+
 
 def _path_for(namespace: str, path: str) -> str:
-    if namespace == DEFAULT_NAMESPACE or not namespace:
+    # the default namespace is the empty string
+    if not namespace:
         return path
 
     return f"{path}/{namespace}"
 
 
+def _query_vector(vector: Any, normalize: bool) -> Any:
+    if normalize:
+        return normalize_vector(vector)
+
+    return convert_to_payload_vector(vector)
+
+
+def _query_results(response: List[Any], payload: Dict[str, Any]) -> List[QueryResult]:
+    if (
+        payload["includeVectors"]
+        or payload["includeMetadata"]
+        or payload["includeData"]
+    ):
+        return list(map(QueryResult._from_json, response))
+
+    return list(map(QueryResult._from_json_without_fields, response))
+
+
+def _fetch_result_parser(
+    include_vectors: bool, include_metadata: bool, include_data: bool
+) -> Callable[[dict], FetchResult]:
+    if include_vectors or include_metadata or include_data:
+        return FetchResult._from_json
+
+    return FetchResult._from_json_without_fields
+
+
+def _range_result(response: Dict[str, Any], payload: Dict[str, Any]) -> RangeResult:
+    if (
+        payload["includeVectors"]
+        or payload["includeMetadata"]
+        or payload["includeData"]
+    ):
+        return RangeResult._from_json(response)
+
+    return RangeResult._from_json_without_fields(response)
+
+
+def _range_payload(
+    cursor: str,
+    limit: int,
+    include_vectors: bool,
+    include_metadata: bool,
+    include_data: bool,
+) -> Dict[str, Any]:
+    if limit <= 0:
+        raise ClientError("limit must be greater than 0")
+
+    return {
+        "cursor": cursor,
+        "limit": limit,
+        "includeVectors": include_vectors,
+        "includeMetadata": include_metadata,
+        "includeData": include_data,
+    }
+
+
+def _columnar_range_result(
+    response: Dict[str, Any], payload: Dict[str, Any]
+) -> ColumnarRangeResult:
+    return ColumnarRangeResult._from_json(
+        response,
+        payload["includeVectors"],
+        payload["includeMetadata"],
+        payload["includeData"],
+    )
+
+
+def _id_sequence(ids: Union[str, Iterable[str]]) -> Sequence[str]:
+    if isinstance(ids, (list, tuple)):
+        # both are serialized as they are, without a copy
+        return ids
+
+    if isinstance(ids, str) or not isinstance(ids, Iterable):
+        return [ids]  # type: ignore[list-item]
+
+    return list(ids)
+
+
+def _unique_ids(ids: Sequence[str]) -> Sequence[str]:
+    # the given ids are returned as they are when there are no
+    # duplicates, so that callers can check it by identity.
+    if len(ids) < 4:
+        return ids
+
+    unique_ids = list(dict.fromkeys(ids))
+    if len(unique_ids) == len(ids):
+        return ids
+
+    return unique_ids
+
+
+def _raise_first_error(results: List[Any]) -> List[Any]:
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    return results
+
+
+def _batched(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    if len(items) <= size:
+        return [items]
+
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
 class IndexOperations:
+    _query_cache: Optional[QueryCache] = None
+    _info_ttl: float = 0.0
+    _info_cache: Optional[Tuple[float, InfoResult]] = None
+    _namespaces_cache: Optional[Tuple[float, List[str]]] = None
+    # incremented on every write, so that the responses of the requests
+    # that were in flight during a write are not cached.
+    _write_generation: int = 0
+
     def _execute_request(self, payload, path):
         raise NotImplementedError("execute_request")
 
+    def _invalidate_caches(self, namespace: Optional[str]) -> None:
+        if self._query_cache is not None:
+            self._query_cache.invalidate(namespace)
+
+        self._write_generation += 1
+        self._info_cache = None
+        self._namespaces_cache = None
+
     def upsert(
         self,
         vectors: Sequence[Union[Dict, tuple, Vector, Data]],
         namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = UPSERT_BATCH_SIZE,
     ) -> str:
         """
         Upserts(update or insert) vectors.
 
         :param vectors: The list vectors to upsert.
         :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of vectors sent in a single request. Larger lists are split into multiple requests.
 
         There are various ways to upsert vectors.
 
@@ -133,11 +312,20 @@ class IndexOperations:
         ```
         """
 
-        vectors = convert_to_vectors(vectors)
-        payload, is_vector = convert_to_payload(vectors)
-        path = UPSERT_PATH if is_vector else UPSERT_DATA_PATH
+        if batch_size <= 0:
+            raise ClientError("batch_size must be greater than 0")
+
+        payload, is_vector = build_upsert_payload(vectors)
+        path = _path_for(namespace, UPSERT_PATH if is_vector else UPSERT_DATA_PATH)
 
-        return self._execute_request(payload=payload, path=_path_for(namespace, path))
+        try:
+            for batch in _batched(payload, batch_size):
+                result = self._execute_request(payload=batch, path=path)
+        finally:
+            # the batches sent before a failed one are still written
+            self._invalidate_caches(namespace)
+
+        return result
 
     def query(
         self,
@@ -149,6 +337,7 @@ class IndexOperations:
         data: Optional[str] = None,
         namespace: str = DEFAULT_NAMESPACE,
         include_data: bool = False,
+        normalize: bool = False,
     ) -> List[QueryResult]:
         """
         Query `top_k` many similar vectors.
@@ -163,6 +352,7 @@ class IndexOperations:
         :param data: Data to query for (after embedding it to a vector)
         :param namespace: The namespace to use. When not specified, the default namespace is used.
         :param include_data: Whether the resulting `top_k` vectors will have their unstructured data or not.
+        :param normalize: Whether to scale the query vector to unit length before sending it.
 
         Example usage:
 
@@ -184,14 +374,6 @@ class IndexOperations:
         )
         ```
         """
-        payload = {
-            "topK": top_k,
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-            "filter": filter,
-        }
-
         if data is None and vector is None:
             raise ClientError("either `data` or `vector` values must be given")
         if data is not None and vector is not None:
@@ -200,24 +382,50 @@ class IndexOperations:
             )
 
         if data is not None:
-            payload["data"] = data
+            payload = {
+                "data": data,
+                "topK": top_k,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+                "filter": filter,
+            }
             path = QUERY_DATA_PATH
         else:
-            payload["vector"] = convert_to_list(vector)
+            payload = {
+                "vector": _query_vector(vector, normalize),
+                "topK": top_k,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+                "filter": filter,
+            }
             path = QUERY_PATH
 
-        return [
-            QueryResult._from_json(obj)
-            for obj in self._execute_request(
-                payload=payload, path=_path_for(namespace, path)
-            )
-        ]
+        cache = self._query_cache
+        if cache is not None:
+            cached = cache.get(namespace, payload)
+            if cached is not None:
+                return cached
+
+            generation = cache.generation
+
+        response = self._execute_request(
+            payload=payload, path=_path_for(namespace, path)
+        )
+        result = _query_results(response, payload)
+
+        if cache is not None:
+            cache.update(namespace, payload, result, generation)
+
+        return result
 
     def query_many(
         self,
         *,
         queries: List[QueryRequest],
         namespace: str = DEFAULT_NAMESPACE,
+        parallel: bool = False,
     ) -> List[List[QueryResult]]:
         """
         Makes a batch query request.
@@ -225,6 +433,13 @@ class IndexOperations:
         The batch should only contain elements whose `data`
         or `vector` fields set.
 
+        When the index has a query cache, only the queries whose
+        results are not cached are sent to the server.
+
+        When `parallel` is set, each query is sent in its own request,
+        and the requests are made concurrently, instead of sending
+        the whole batch in a single request.
+
         Example usage:
 
         ```python
@@ -262,14 +477,48 @@ class IndexOperations:
             single_result = self.query(**query, namespace=namespace)
             return [single_result]
 
+        if parallel and queries:
+            max_workers = min(len(queries), QUERY_MANY_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(
+                    executor.map(
+                        lambda query: self.query(**query, namespace=namespace),
+                        queries,
+                    )
+                )
+
         has_vector_query, payload = convert_query_requests_to_payload(queries)
-        path = QUERY_PATH if has_vector_query else QUERY_DATA_PATH
-        result = self._execute_request(payload=payload, path=_path_for(namespace, path))
+        path = _path_for(namespace, QUERY_PATH if has_vector_query else QUERY_DATA_PATH)
+
+        cache = self._query_cache
+        if cache is None:
+            result = self._execute_request(payload=payload, path=path)
+            return [
+                _query_results(query_result, query_payload)
+                for query_result, query_payload in zip(result, payload)
+            ]
 
-        return [
-            [QueryResult._from_json(obj) for obj in query_result]
-            for query_result in result
-        ]
+        results = [cache.get(namespace, query_payload) for query_payload in payload]
+        misses = [i for i, cached in enumerate(results) if cached is None]
+        generation = cache.generation
+
+        if len(misses) == 1:
+            # the server returns a single response when the length
+            # of the array is 1, so send the query on its own.
+            response = [self._execute_request(payload=payload[misses[0]], path=path)]
+        elif misses:
+            response = self._execute_request(
+                payload=[payload[i] for i in misses], path=path
+            )
+        else:
+            response = []
+
+        for i, query_result in zip(misses, response):
+            query_results = _query_results(query_result, payload[i])
+            cache.update(namespace, payload[i], query_results, generation)
+            results[i] = query_results
+
+        return results  # type: ignore[return-value]
 
     def resumable_query(
         self,
@@ -282,6 +531,7 @@ class IndexOperations:
         namespace: str = DEFAULT_NAMESPACE,
         include_data: bool = False,
         max_idle: int = 3600,
+        normalize: bool = False,
     ) -> Tuple[List[QueryResult], "ResumableQueryHandle"]:
         """
         Creates a resumable query.
@@ -297,6 +547,7 @@ class IndexOperations:
         :param namespace: The namespace to use. When not specified, the default namespace is used.
         :param include_data: Whether the resulting vectors will have their unstructured data or not.
         :param max_idle: Maximum idle time for the resumable query in seconds.
+        :param normalize: Whether to scale the query vector to unit length before sending it.
 
         :return: First batch of the results, along with a handle to fetch more or stop the query.
 
@@ -322,32 +573,39 @@ class IndexOperations:
                 "`data` and `vector` values cannot be given at the same time"
             )
 
-        payload = {
-            "topK": top_k,
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-            "filter": filter,
-            "maxIdle": max_idle,
-        }
-
         if data is not None:
-            payload["data"] = data
+            payload = {
+                "data": data,
+                "topK": top_k,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+                "filter": filter,
+                "maxIdle": max_idle,
+            }
             path = RESUMABLE_QUERY_DATA_PATH
         else:
-            payload["vector"] = convert_to_list(vector)
+            payload = {
+                "vector": _query_vector(vector, normalize),
+                "topK": top_k,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+                "filter": filter,
+                "maxIdle": max_idle,
+            }
             path = RESUMABLE_QUERY_PATH
 
         result = self._execute_request(payload=payload, path=_path_for(namespace, path))
 
         uid = result["uuid"]
-        scores = [QueryResult._from_json(obj) for obj in result["scores"]]
+        scores = _query_results(result["scores"], payload)
 
         return scores, ResumableQueryHandle(self._execute_request, uid)
 
     def delete(
         self,
-        ids: Union[str, List[str]],
+        ids: Union[str, Iterable[str]],
         namespace: str = DEFAULT_NAMESPACE,
     ) -> DeleteResult:
         """
@@ -355,9 +613,11 @@ class IndexOperations:
 
         Response contains deleted vector count.
 
-        :param ids: Singular or list of ids of vector(s) to be deleted.
+        :param ids: Singular id, or an iterable of ids of vector(s) to be deleted.
         :param namespace: The namespace to use. When not specified, the default namespace is used.
 
+        Lists longer than `ID_BATCH_SIZE` are split into multiple requests.
+
         Example usage:
 
         ```python
@@ -368,12 +628,19 @@ class IndexOperations:
         index.delete("0")
         ```
         """
-        if not isinstance(ids, list):
-            ids = [ids]
+        id_sequence = _id_sequence(ids)
 
-        return DeleteResult._from_json(
-            self._execute_request(payload=ids, path=_path_for(namespace, DELETE_PATH))
-        )
+        path = _path_for(namespace, DELETE_PATH)
+        deleted = 0
+        try:
+            for batch in _batched(id_sequence, ID_BATCH_SIZE):
+                result = self._execute_request(payload=batch, path=path)
+                deleted += DeleteResult._from_json(result).deleted
+        finally:
+            # the batches sent before a failed one are still deleted
+            self._invalidate_caches(namespace)
+
+        return DeleteResult(deleted=deleted)
 
     def reset(self, namespace: str = DEFAULT_NAMESPACE, all: bool = False) -> str:
         """
@@ -393,7 +660,9 @@ class IndexOperations:
         else:
             path = _path_for(namespace, RESET_PATH)
 
-        return self._execute_request(path=path, payload=None)
+        result = self._execute_request(path=path, payload=None)
+        self._invalidate_caches(None if all else namespace)
+        return result
 
     def range(
         self,
@@ -420,25 +689,104 @@ class IndexOperations:
         res = index.range(cursor="", limit=100, include_vectors=False, include_metadata=True)
         ```
         """
-        if limit <= 0:
-            raise ClientError("limit must be greater than 0")
+        payload = _range_payload(
+            cursor, limit, include_vectors, include_metadata, include_data
+        )
+        return _range_result(
+            self._execute_request(
+                payload=payload, path=_path_for(namespace, RANGE_PATH)
+            ),
+            payload,
+        )
 
-        payload = {
-            "cursor": cursor,
-            "limit": limit,
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-        }
-        return RangeResult._from_json(
+    def range_columnar(
+        self,
+        cursor: str = "",
+        limit: int = 1,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+    ) -> ColumnarRangeResult:
+        """
+        Scans the vectors starting from `cursor` like `range`, but returns the
+        fields of the vectors in columns instead of a `FetchResult` per vector.
+
+        The vector values are returned as a single `numpy.ndarray` of float32,
+        with a row for each vector, which requires `numpy` to be installed.
+
+        :param cursor: Marker that indicates where the scanning was left off when running through all existing vectors.
+        :param limit: Limits how many vectors will be fetched with the request.
+        :param include_vectors: Whether the vector values are returned or not.
+        :param include_metadata: Whether the metadata are returned or not.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param include_data: Whether the unstructured data are returned or not.
+
+        Example usage:
+
+        ```python
+        res = index.range_columnar(cursor="", limit=1000, include_vectors=True)
+        similarities = res.vectors @ query
+        ```
+        """
+        if include_vectors and np is None:
+            raise ClientError("numpy is required for the columnar vector values")
+
+        payload = _range_payload(
+            cursor, limit, include_vectors, include_metadata, include_data
+        )
+        return _columnar_range_result(
             self._execute_request(
                 payload=payload, path=_path_for(namespace, RANGE_PATH)
-            )
+            ),
+            payload,
         )
 
+    def iter_range(
+        self,
+        limit: int = 100,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        cursor: str = "",
+    ) -> Iterator[FetchResult]:
+        """
+        Iterates over all the vectors of a namespace, fetching at most `limit` many vectors per request.
+
+        :param limit: Limits how many vectors will be fetched with each request.
+        :param include_vectors: Whether the resulting vectors will have their vector values or not.
+        :param include_metadata: Whether the resulting vectors will have their metadata or not.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param include_data: Whether the resulting vectors will have their unstructured data or not.
+        :param cursor: Cursor to start the iteration from. When not specified, the iteration starts from the beginning.
+
+        Example usage:
+
+        ```python
+        for vector in index.iter_range(limit=100, include_metadata=True):
+            print(vector.id, vector.metadata)
+        ```
+        """
+        range_page = self.range
+        while True:
+            res = range_page(
+                cursor=cursor,
+                limit=limit,
+                include_vectors=include_vectors,
+                include_metadata=include_metadata,
+                namespace=namespace,
+                include_data=include_data,
+            )
+            yield from res.vectors
+
+            cursor = res.next_cursor
+            if not cursor:
+                return
+
     def fetch(
         self,
-        ids: Union[str, List[str]],
+        ids: Union[str, Iterable[str]],
         include_vectors: bool = False,
         include_metadata: bool = False,
         namespace: str = DEFAULT_NAMESPACE,
@@ -447,38 +795,49 @@ class IndexOperations:
         """
         Fetches details of a set of vectors.
 
-        :param ids: List of vector ids to fetch details of.
+        :param ids: Singular id, or an iterable of ids of the vectors to fetch details of.
         :param include_vectors: Whether the resulting vectors will have their vector values or not.
         :param include_metadata: Whether the resulting vectors will have their metadata or not.
         :param namespace: The namespace to use. When not specified, the default namespace is used.
         :param include_data: Whether the resulting `top_k` vectors will have their unstructured data or not.
 
+        Lists longer than `ID_BATCH_SIZE` are split into multiple requests.
+        Duplicate ids are fetched once, and their results are repeated.
+
         Example usage:
 
         ```python
         res = index.fetch(["id1", "id2"], include_vectors=False, include_metadata=True)
         ```
         """
-        if not isinstance(ids, list):
-            ids = [ids]
-
-        payload = {
-            "ids": ids,
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-        }
-        return [
-            FetchResult._from_json(vector) if vector else None
-            for vector in self._execute_request(
-                payload=payload, path=_path_for(namespace, FETCH_PATH)
+        id_sequence = _id_sequence(ids)
+        unique_ids = _unique_ids(id_sequence)
+
+        path = _path_for(namespace, FETCH_PATH)
+        parse = _fetch_result_parser(include_vectors, include_metadata, include_data)
+        fetched: List[Optional[FetchResult]] = []
+        for batch in _batched(unique_ids, ID_BATCH_SIZE):
+            payload = {
+                "ids": batch,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+            }
+            fetched.extend(
+                parse(vector) if vector else None
+                for vector in self._execute_request(payload=payload, path=path)
             )
-        ]
+
+        if unique_ids is not id_sequence:
+            by_id = dict(zip(unique_ids, fetched))
+            return [by_id[id] for id in id_sequence]
+
+        return fetched
 
     def update(
         self,
         id: str,
-        vector: Optional[List[float]] = None,
+        vector: Optional[Union[Sequence[float], SupportsToList]] = None,
         data: Optional[str] = None,
         metadata: Optional[Dict] = None,
         namespace: str = DEFAULT_NAMESPACE,
@@ -508,7 +867,7 @@ class IndexOperations:
         }
 
         if vector is not None:
-            payload["vector"] = vector
+            payload["vector"] = convert_to_payload_vector(vector)
 
         if data is not None:
             payload["data"] = data
@@ -519,9 +878,39 @@ class IndexOperations:
         result = self._execute_request(
             payload=payload, path=_path_for(namespace, UPDATE_PATH)
         )
+        self._invalidate_caches(namespace)
         updated = result["updated"]
         return updated == 1
 
+    def update_many(
+        self,
+        requests: Sequence[UpdateRequest],
+        namespace: str = DEFAULT_NAMESPACE,
+    ) -> List[bool]:
+        """
+        Updates the vector values, data, or metadata of many vectors.
+
+        The API has no batch update, so each vector is updated with
+        its own request.
+
+        Returns whether each vector is updated or not, in the order of the requests.
+
+        :param requests: The updates to make. Each of them accepts the same fields as the arguments of `update`.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+
+        Example usage:
+
+        ```python
+        updated = index.update_many(
+            [
+                {"id": "id1", "vector": [0.1, 0.2]},
+                {"id": "id2", "metadata": {"new_field": "new_value"}},
+            ]
+        )
+        ```
+        """
+        return [self.update(**request, namespace=namespace) for request in requests]
+
     def info(self) -> InfoResult:
         """
         Returns the index info, including:
@@ -532,16 +921,44 @@ class IndexOperations:
         * Vector dimension
         * Similarity function used
         * Per-namespace vector and pending vector counts
+
+        When the client is created with an `info_ttl`, the info is reused
+        for that many seconds, or until a write is made through the client.
         """
-        return InfoResult._from_json(
+        cached = self._info_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        generation = self._write_generation
+        result = InfoResult._from_json(
             self._execute_request(payload=None, path=INFO_PATH)
         )
 
+        if self._info_ttl > 0 and generation == self._write_generation:
+            self._info_cache = (time.monotonic() + self._info_ttl, result)
+
+        return result
+
     def list_namespaces(self) -> List[str]:
         """
         Returns the list of names of namespaces.
+
+        When the client is created with an `info_ttl`, the list is reused
+        for that many seconds, or until a write is made through the client.
         """
-        return self._execute_request(payload=None, path=LIST_NAMESPACES_PATH)
+        cached = self._namespaces_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return list(cached[1])
+
+        generation = self._write_generation
+        result = self._execute_request(payload=None, path=LIST_NAMESPACES_PATH)
+
+        if self._info_ttl > 0:
+            if generation == self._write_generation:
+                self._namespaces_cache = (time.monotonic() + self._info_ttl, result)
+            return list(result)
+
+        return result
 
     def delete_namespace(self, namespace: str) -> None:
         """
@@ -551,22 +968,57 @@ class IndexOperations:
         self._execute_request(
             payload=None, path=_path_for(namespace, DELETE_NAMESPACE_PATH)
         )
+        self._invalidate_caches(namespace)
 
 
 class AsyncIndexOperations:
+    _query_cache: Optional[QueryCache] = None
+    _info_ttl: float = 0.0
+    _info_cache: Optional[Tuple[float, InfoResult]] = None
+    _namespaces_cache: Optional[Tuple[float, List[str]]] = None
+    # incremented on every write, so that the responses of the requests
+    # that were in flight during a write are not cached.
+    _write_generation: int = 0
+    _info_lock: Optional[asyncio.Lock] = None
+    _namespaces_lock: Optional[asyncio.Lock] = None
+    _upsert_buffers: Optional[Dict[Tuple[str, bool], UpsertBuffer]] = None
+    _inflight_queries: Optional[Dict[Any, "asyncio.Future[List[QueryResult]]"]] = None
+    _fetch_coalescing_window: float = 0.0
+    _fetch_coalescers: Optional[
+        Dict[Tuple[str, bool, bool, bool, int], FetchCoalescer]
+    ] = None
+    _pending_writes: Optional[Set["asyncio.Task[Any]"]] = None
+    _pending_writes_semaphore: Optional[asyncio.Semaphore] = None
+
     async def _execute_request_async(self, payload, path):
         raise NotImplementedError("execute_request")
 
+    def _invalidate_caches(self, namespace: Optional[str]) -> None:
+        if self._query_cache is not None:
+            self._query_cache.invalidate(namespace)
+
+        self._write_generation += 1
+        self._info_cache = None
+        self._namespaces_cache = None
+
+        # the queries started before the write should not be
+        # shared with the ones started after it.
+        self._inflight_queries = None
+
     async def upsert(
         self,
         vectors: Sequence[Union[Dict, tuple, Vector, Data]],
         namespace: str = DEFAULT_NAMESPACE,
+        batch_size: int = UPSERT_BATCH_SIZE,
+        max_concurrency: int = UPSERT_MAX_CONCURRENCY,
     ) -> str:
         """
         Upserts(update or insert) vectors.
 
         :param vectors: The list vectors to upsert.
         :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param batch_size: Maximum number of vectors sent in a single request. Larger lists are split into multiple requests.
+        :param max_concurrency: Maximum number of requests sent concurrently when the vectors are split into multiple requests.
 
         There are various ways to upsert vectors.
 
@@ -626,13 +1078,173 @@ class AsyncIndexOperations:
         )
         ```
         """
-        vectors = convert_to_vectors(vectors)
-        payload, is_vector = convert_to_payload(vectors)
-        path = UPSERT_PATH if is_vector else UPSERT_DATA_PATH
+        if batch_size <= 0:
+            raise ClientError("batch_size must be greater than 0")
+
+        if max_concurrency <= 0:
+            raise ClientError("max_concurrency must be greater than 0")
+
+        payload, is_vector = build_upsert_payload(vectors)
+        path = _path_for(namespace, UPSERT_PATH if is_vector else UPSERT_DATA_PATH)
+
+        batches = _batched(payload, batch_size)
+        if len(batches) == 1:
+            try:
+                return await self._execute_request_async(payload=batches[0], path=path)
+            finally:
+                self._invalidate_caches(namespace)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def upsert_batch(batch: Sequence[Dict[str, Any]]) -> str:
+            async with semaphore:
+                return await self._execute_request_async(payload=batch, path=path)
+
+        try:
+            # all the batches are waited for, even if one of them fails,
+            # so that the caches are not invalidated while the others
+            # are still being written.
+            results = await asyncio.gather(
+                *[upsert_batch(batch) for batch in batches], return_exceptions=True
+            )
+        finally:
+            self._invalidate_caches(namespace)
 
-        return await self._execute_request_async(
-            payload=payload, path=_path_for(namespace, path)
+        return _raise_first_error(results)[-1]
+
+    async def upsert_buffered(
+        self,
+        vector: Union[Dict, tuple, Vector, Data],
+        namespace: str = DEFAULT_NAMESPACE,
+        flush_after_ms: float = UPSERT_BUFFER_FLUSH_AFTER_MS,
+        max_batch: int = UPSERT_BUFFER_MAX_BATCH,
+    ) -> str:
+        """
+        Upserts a single vector, batching it together with the other vectors
+        upserted into the same namespace concurrently.
+
+        The batch is upserted once it has `max_batch` vectors, or
+        `flush_after_ms` milliseconds after its first vector is added.
+        Returns once the batch of the vector is upserted.
+
+        :param vector: The vector to upsert, in any of the forms accepted by `upsert`.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param flush_after_ms: Maximum time to wait for more vectors before upserting the batch.
+        :param max_batch: Maximum number of vectors upserted in a single request.
+
+        Example usage:
+
+        ```python
+        await asyncio.gather(
+            *[index.upsert_buffered((f"id{i}", [0.1, 0.2])) for i in range(1000)]
         )
+        ```
+        """
+        if flush_after_ms < 0:
+            raise ClientError("flush_after_ms must not be negative")
+
+        if max_batch <= 0:
+            raise ClientError("max_batch must be greater than 0")
+
+        # converted here, so that invalid vectors fail on their own,
+        # and not the whole batch they would be upserted with.
+        payload, is_vector = build_upsert_payload([vector])
+
+        # vectors and data cannot be upserted together, so they are
+        # batched separately.
+        key = (namespace, is_vector)
+
+        buffers = self._upsert_buffers
+        if buffers is None:
+            buffers = self._upsert_buffers = {}
+
+        buffer = buffers.get(key)
+        if buffer is None:
+
+            async def upsert(vectors: List[Any]) -> str:
+                return await self.upsert(vectors, namespace=namespace)
+
+            buffer = buffers[key] = UpsertBuffer(upsert)
+
+        return await buffer.add(payload[0], flush_after_ms / 1000, max_batch)
+
+    async def flush_upserts(self) -> None:
+        """
+        Upserts the vectors waiting in the buffers of `upsert_buffered`,
+        and waits for all the buffered upserts to complete.
+        """
+        if self._upsert_buffers is None:
+            return
+
+        for buffer in list(self._upsert_buffers.values()):
+            await buffer.flush()
+
+    async def flush_writes(self) -> None:
+        """
+        Sends the buffered upserts, and waits for them and for the writes
+        made with `wait=False` to complete.
+
+        If one of the writes made with `wait=False` has failed, its error
+        is raised here. If more than one has failed, a `BackgroundWriteError`
+        with all of their errors is raised.
+
+        Example usage:
+
+        ```python
+        for i in range(1000):
+            await index.update(f"id{i}", metadata={"tag": "new"}, wait=False)
+
+        await index.flush_writes()
+        ```
+        """
+        await self.flush_upserts()
+
+        writes = self._pending_writes
+        if not writes:
+            return
+
+        tasks = list(writes)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        writes.difference_update(tasks)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) == 1:
+            raise errors[0]
+
+        if errors:
+            raise BackgroundWriteError(errors) from errors[0]
+
+    def _write_in_background(self, write: Awaitable[Any]) -> None:
+        writes = self._pending_writes
+        if writes is None:
+            writes = self._pending_writes = set()
+
+        semaphore = self._pending_writes_semaphore
+        if semaphore is None:
+            semaphore = self._pending_writes_semaphore = asyncio.Semaphore(
+                BACKGROUND_WRITE_MAX_CONCURRENCY
+            )
+
+        async def bounded_write() -> Any:
+            async with semaphore:
+                return await write
+
+        def done(task: "asyncio.Task[Any]") -> None:
+            # the failed writes are kept, so that their errors
+            # are raised by the next flush.
+            if task.cancelled() or task.exception() is None:
+                writes.discard(task)
+
+        task = asyncio.ensure_future(bounded_write())
+        writes.add(task)
+        task.add_done_callback(done)
+
+    async def _flush_fetches(self) -> None:
+        if self._fetch_coalescers is None:
+            return
+
+        for coalescer in list(self._fetch_coalescers.values()):
+            await coalescer.flush()
 
     async def query(
         self,
@@ -644,6 +1256,7 @@ class AsyncIndexOperations:
         data: Optional[str] = None,
         namespace: str = DEFAULT_NAMESPACE,
         include_data: bool = False,
+        normalize: bool = False,
     ) -> List[QueryResult]:
         """
         Query `top_k` many similar vectors.
@@ -658,6 +1271,7 @@ class AsyncIndexOperations:
         :param data: Data to query for (after embedding it to a vector)
         :param namespace: The namespace to use. When not specified, the default namespace is used.
         :param include_data: Whether the resulting `top_k` vectors will have their unstructured data or not.
+        :param normalize: Whether to scale the query vector to unit length before sending it.
 
         Example usage:
 
@@ -679,14 +1293,6 @@ class AsyncIndexOperations:
         )
         ```
         """
-        payload = {
-            "topK": top_k,
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-            "filter": filter,
-        }
-
         if data is None and vector is None:
             raise ClientError("either `data` or `vector` values must be given")
         if data is not None and vector is not None:
@@ -695,24 +1301,101 @@ class AsyncIndexOperations:
             )
 
         if data is not None:
-            payload["data"] = data
+            payload = {
+                "data": data,
+                "topK": top_k,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+                "filter": filter,
+            }
             path = QUERY_DATA_PATH
         else:
-            payload["vector"] = convert_to_list(vector)
+            payload = {
+                "vector": _query_vector(vector, normalize),
+                "topK": top_k,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+                "filter": filter,
+            }
             path = QUERY_PATH
 
-        return [
-            QueryResult._from_json(obj)
-            for obj in await self._execute_request_async(
-                payload=payload, path=_path_for(namespace, path)
-            )
-        ]
+        key = request_key(namespace, payload)
+
+        cache = self._query_cache
+        if cache is not None:
+            cached = cache.get(namespace, payload, key)
+            if cached is not None:
+                return cached
+
+        # identical queries made concurrently share a single request
+        inflight = self._inflight_queries
+        if inflight is None:
+            inflight = self._inflight_queries = {}
+
+        inflight_key = (key, top_k)
+        joined = inflight.get(inflight_key)
+        while joined is not None:
+            # shielded, so that cancelling one of the calls that join
+            # does not cancel the request of the others.
+            try:
+                return list(await asyncio.shield(joined))
+            except asyncio.CancelledError:
+                if not joined.cancelled():
+                    raise
+
+            # the call that made the request is cancelled
+            joined = inflight.get(inflight_key)
+
+        # the request is awaited directly, and the future is only
+        # awaited by the calls that join while it is in flight.
+        future: "asyncio.Future[List[QueryResult]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        inflight[inflight_key] = future
+        try:
+            result = await self._query_request(payload, namespace, path, key)
+        except Exception as e:
+            future.set_exception(e)
+            # marked as retrieved, so that it is not logged when no call joins
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            if inflight.get(inflight_key) is future:
+                del inflight[inflight_key]
+
+        return result
+
+    async def _query_request(
+        self, payload: Dict[str, Any], namespace: str, path: str, key: Any
+    ) -> List[QueryResult]:
+        cache = self._query_cache
+        # the results of the queries that are in flight during a write
+        # are not cached, as they might be from before the write.
+        generation = cache.generation if cache is not None else None
+
+        response = await self._execute_request_async(
+            payload=payload, path=_path_for(namespace, path)
+        )
+        result = _query_results(response, payload)
+
+        if cache is not None:
+            cache.update(namespace, payload, result, generation, key)
+
+        return result
 
     async def query_many(
         self,
         *,
         queries: List[QueryRequest],
         namespace: str = DEFAULT_NAMESPACE,
+        parallel: bool = False,
     ) -> List[List[QueryResult]]:
         """
         Makes a batch query request.
@@ -720,6 +1403,13 @@ class AsyncIndexOperations:
         The batch should only contain elements whose `data`
         or `vector` fields set.
 
+        When the index has a query cache, only the queries whose
+        results are not cached are sent to the server.
+
+        When `parallel` is set, each query is sent in its own request,
+        and the requests are made concurrently, instead of sending
+        the whole batch in a single request.
+
         Example usage:
 
         ```python
@@ -757,16 +1447,47 @@ class AsyncIndexOperations:
             single_result = await self.query(**query, namespace=namespace)
             return [single_result]
 
+        if parallel and queries:
+            return list(
+                await asyncio.gather(
+                    *[self.query(**query, namespace=namespace) for query in queries]
+                )
+            )
+
         has_vector_query, payload = convert_query_requests_to_payload(queries)
-        path = QUERY_PATH if has_vector_query else QUERY_DATA_PATH
-        result = await self._execute_request_async(
-            payload=payload, path=_path_for(namespace, path)
-        )
+        path = _path_for(namespace, QUERY_PATH if has_vector_query else QUERY_DATA_PATH)
+
+        cache = self._query_cache
+        if cache is None:
+            result = await self._execute_request_async(payload=payload, path=path)
+            return [
+                _query_results(query_result, query_payload)
+                for query_result, query_payload in zip(result, payload)
+            ]
 
-        return [
-            [QueryResult._from_json(obj) for obj in query_result]
-            for query_result in result
-        ]
+        results = [cache.get(namespace, query_payload) for query_payload in payload]
+        misses = [i for i, cached in enumerate(results) if cached is None]
+        generation = cache.generation
+
+        if len(misses) == 1:
+            # the server returns a single response when the length
+            # of the array is 1, so send the query on its own.
+            response = [
+                await self._execute_request_async(payload=payload[misses[0]], path=path)
+            ]
+        elif misses:
+            response = await self._execute_request_async(
+                payload=[payload[i] for i in misses], path=path
+            )
+        else:
+            response = []
+
+        for i, query_result in zip(misses, response):
+            query_results = _query_results(query_result, payload[i])
+            cache.update(namespace, payload[i], query_results, generation)
+            results[i] = query_results
+
+        return results  # type: ignore[return-value]
 
     async def resumable_query(
         self,
@@ -779,6 +1500,7 @@ class AsyncIndexOperations:
         namespace: str = DEFAULT_NAMESPACE,
         include_data: bool = False,
         max_idle: int = 3600,
+        normalize: bool = False,
     ) -> Tuple[List[QueryResult], "AsyncResumableQueryHandle"]:
         """
         Creates a resumable query.
@@ -794,6 +1516,7 @@ class AsyncIndexOperations:
         :param namespace: The namespace to use. When not specified, the default namespace is used.
         :param include_data: Whether the resulting vectors will have their unstructured data or not.
         :param max_idle: Maximum idle time for the resumable query in seconds.
+        :param normalize: Whether to scale the query vector to unit length before sending it.
 
         :return: First batch of the results, along with a handle to fetch more or stop the query.
 
@@ -819,20 +1542,27 @@ class AsyncIndexOperations:
                 "`data` and `vector` values cannot be given at the same time"
             )
 
-        payload = {
-            "topK": top_k,
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-            "filter": filter,
-            "maxIdle": max_idle,
-        }
-
         if data is not None:
-            payload["data"] = data
+            payload = {
+                "data": data,
+                "topK": top_k,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+                "filter": filter,
+                "maxIdle": max_idle,
+            }
             path = RESUMABLE_QUERY_DATA_PATH
         else:
-            payload["vector"] = convert_to_list(vector)
+            payload = {
+                "vector": _query_vector(vector, normalize),
+                "topK": top_k,
+                "includeVectors": include_vectors,
+                "includeMetadata": include_metadata,
+                "includeData": include_data,
+                "filter": filter,
+                "maxIdle": max_idle,
+            }
             path = RESUMABLE_QUERY_PATH
 
         result = await self._execute_request_async(
@@ -840,22 +1570,27 @@ class AsyncIndexOperations:
         )
 
         uid = result["uuid"]
-        scores = [QueryResult._from_json(obj) for obj in result["scores"]]
+        scores = _query_results(result["scores"], payload)
 
         return scores, AsyncResumableQueryHandle(self._execute_request_async, uid)
 
     async def delete(
         self,
-        ids: Union[str, List[str]],
+        ids: Union[str, Iterable[str]],
         namespace: str = DEFAULT_NAMESPACE,
+        max_concurrency: int = ID_BATCH_MAX_CONCURRENCY,
     ) -> DeleteResult:
         """
         Deletes the given vector(s) with given ids asynchronously.
 
         Response contains deleted vector count.
 
-        :param ids: Singular or list of ids of vector(s) to be deleted.
+        :param ids: Singular id, or an iterable of ids of vector(s) to be deleted.
         :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param max_concurrency: Maximum number of requests sent concurrently when the ids are split into multiple requests.
+
+        Lists longer than `ID_BATCH_SIZE` are split into multiple requests,
+        which are sent concurrently, at most `max_concurrency` at a time.
 
         Example usage:
 
@@ -867,13 +1602,39 @@ class AsyncIndexOperations:
         await index.delete("0")
         ```
         """
-        if not isinstance(ids, list):
-            ids = [ids]
-
-        return DeleteResult._from_json(
-            await self._execute_request_async(
-                payload=ids, path=_path_for(namespace, DELETE_PATH)
-            )
+        if max_concurrency <= 0:
+            raise ClientError("max_concurrency must be greater than 0")
+
+        id_sequence = _id_sequence(ids)
+
+        path = _path_for(namespace, DELETE_PATH)
+
+        batches = _batched(id_sequence, ID_BATCH_SIZE)
+        try:
+            if len(batches) == 1:
+                results = [
+                    await self._execute_request_async(payload=batches[0], path=path)
+                ]
+            else:
+                semaphore = asyncio.Semaphore(max_concurrency)
+
+                async def delete_batch(batch: Sequence[str]) -> Any:
+                    async with semaphore:
+                        return await self._execute_request_async(
+                            payload=batch, path=path
+                        )
+
+                # all the batches are waited for, as in upsert
+                results = _raise_first_error(
+                    await asyncio.gather(
+                        *map(delete_batch, batches), return_exceptions=True
+                    )
+                )
+        finally:
+            self._invalidate_caches(namespace)
+
+        return DeleteResult(
+            deleted=sum(DeleteResult._from_json(result).deleted for result in results)
         )
 
     async def reset(self, namespace: str = DEFAULT_NAMESPACE, all: bool = False) -> str:
@@ -894,7 +1655,9 @@ class AsyncIndexOperations:
         else:
             path = _path_for(namespace, RESET_PATH)
 
-        return await self._execute_request_async(path=path, payload=None)
+        result = await self._execute_request_async(path=path, payload=None)
+        self._invalidate_caches(None if all else namespace)
+        return result
 
     async def range(
         self,
@@ -921,38 +1684,146 @@ class AsyncIndexOperations:
         res = await index.range(cursor="cursor", limit=4, include_vectors=False, include_metadata=True)
         ```
         """
-        if limit <= 0:
-            raise ClientError("limit must be greater than 0")
+        payload = _range_payload(
+            cursor, limit, include_vectors, include_metadata, include_data
+        )
+        return _range_result(
+            await self._execute_request_async(
+                payload=payload, path=_path_for(namespace, RANGE_PATH)
+            ),
+            payload,
+        )
 
-        payload = {
-            "cursor": cursor,
-            "limit": limit,
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-        }
-        return RangeResult._from_json(
+    async def range_columnar(
+        self,
+        cursor: str = "",
+        limit: int = 1,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+    ) -> ColumnarRangeResult:
+        """
+        Scans the vectors asynchronously starting from `cursor` like `range`, but returns
+        the fields of the vectors in columns instead of a `FetchResult` per vector.
+
+        The vector values are returned as a single `numpy.ndarray` of float32,
+        with a row for each vector, which requires `numpy` to be installed.
+
+        :param cursor: Marker that indicates where the scanning was left off when running through all existing vectors.
+        :param limit: Limits how many vectors will be fetched with the request.
+        :param include_vectors: Whether the vector values are returned or not.
+        :param include_metadata: Whether the metadata are returned or not.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param include_data: Whether the unstructured data are returned or not.
+
+        Example usage:
+
+        ```python
+        res = await index.range_columnar(cursor="", limit=1000, include_vectors=True)
+        similarities = res.vectors @ query
+        ```
+        """
+        if include_vectors and np is None:
+            raise ClientError("numpy is required for the columnar vector values")
+
+        payload = _range_payload(
+            cursor, limit, include_vectors, include_metadata, include_data
+        )
+        return _columnar_range_result(
             await self._execute_request_async(
                 payload=payload, path=_path_for(namespace, RANGE_PATH)
-            )
+            ),
+            payload,
         )
 
+    async def iter_range(
+        self,
+        limit: int = 100,
+        include_vectors: bool = False,
+        include_metadata: bool = False,
+        namespace: str = DEFAULT_NAMESPACE,
+        include_data: bool = False,
+        cursor: str = "",
+        prefetch: bool = True,
+    ) -> AsyncIterator[FetchResult]:
+        """
+        Iterates over all the vectors of a namespace asynchronously, fetching at most `limit` many vectors per request.
+
+        Unless `prefetch` is disabled, the next page is requested while the vectors of the current page are consumed.
+
+        :param limit: Limits how many vectors will be fetched with each request.
+        :param include_vectors: Whether the resulting vectors will have their vector values or not.
+        :param include_metadata: Whether the resulting vectors will have their metadata or not.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param include_data: Whether the resulting vectors will have their unstructured data or not.
+        :param cursor: Cursor to start the iteration from. When not specified, the iteration starts from the beginning.
+        :param prefetch: Whether to request the next page before the vectors of the current page are consumed.
+
+        Example usage:
+
+        ```python
+        async for vector in index.iter_range(limit=100, include_metadata=True):
+            print(vector.id, vector.metadata)
+        ```
+        """
+
+        def fetch_page(page_cursor: str) -> "asyncio.Task[RangeResult]":
+            return asyncio.ensure_future(
+                self.range(
+                    cursor=page_cursor,
+                    limit=limit,
+                    include_vectors=include_vectors,
+                    include_metadata=include_metadata,
+                    namespace=namespace,
+                    include_data=include_data,
+                )
+            )
+
+        page = fetch_page(cursor)
+        try:
+            while True:
+                res = await page
+                if res.next_cursor and prefetch:
+                    page = fetch_page(res.next_cursor)
+
+                for vector in res.vectors:
+                    yield vector
+
+                if not res.next_cursor:
+                    return
+
+                if not prefetch:
+                    page = fetch_page(res.next_cursor)
+        finally:
+            page.cancel()
+
     async def fetch(
         self,
-        ids: Union[str, List[str]],
+        ids: Union[str, Iterable[str]],
         include_vectors: bool = False,
         include_metadata: bool = False,
         namespace: str = DEFAULT_NAMESPACE,
         include_data: bool = False,
+        max_concurrency: int = ID_BATCH_MAX_CONCURRENCY,
     ) -> List[Optional[FetchResult]]:
         """
         Fetches details of a set of vectors asynchronously.
 
-        :param ids: List of vector ids to fetch details of.
+        :param ids: Singular id, or an iterable of ids of the vectors to fetch details of.
         :param include_vectors: Whether the resulting vectors will have their vector values or not.
         :param include_metadata: Whether the resulting vectors will have their metadata or not.
         :param namespace: The namespace to use. When not specified, the default namespace is used.
         :param include_data: Whether the resulting `top_k` vectors will have their unstructured data or not.
+        :param max_concurrency: Maximum number of requests sent concurrently when the ids are split into multiple requests.
+
+        Lists longer than `ID_BATCH_SIZE` are split into multiple requests,
+        which are sent concurrently, at most `max_concurrency` at a time.
+        Duplicate ids are fetched once, and their results are repeated.
+
+        When the client is created with a `fetch_coalescing_window`, the
+        fetches made concurrently within that window, with the same
+        namespace and parameters, are sent together in a single request.
 
         Example usage:
 
@@ -960,30 +1831,111 @@ class AsyncIndexOperations:
         res = await index.fetch(["id1", "id2"], include_vectors=False, include_metadata=True)
         ```
         """
-        if not isinstance(ids, list):
-            ids = [ids]
+        if max_concurrency <= 0:
+            raise ClientError("max_concurrency must be greater than 0")
+
+        id_sequence = _id_sequence(ids)
+
+        if self._fetch_coalescing_window > 0:
+            key = (
+                namespace,
+                include_vectors,
+                include_metadata,
+                include_data,
+                max_concurrency,
+            )
 
-        payload = {
-            "ids": ids,
-            "includeVectors": include_vectors,
-            "includeMetadata": include_metadata,
-            "includeData": include_data,
-        }
-        return [
-            FetchResult._from_json(vector) if vector else None
-            for vector in await self._execute_request_async(
-                payload=payload, path=_path_for(namespace, FETCH_PATH)
+            coalescers = self._fetch_coalescers
+            if coalescers is None:
+                coalescers = self._fetch_coalescers = {}
+
+            coalescer = coalescers.get(key)
+            if coalescer is None:
+
+                async def fetch(
+                    coalesced_ids: List[str],
+                ) -> List[Optional[FetchResult]]:
+                    return await self._fetch(
+                        coalesced_ids,
+                        include_vectors,
+                        include_metadata,
+                        namespace,
+                        include_data,
+                        max_concurrency,
+                    )
+
+                coalescer = coalescers[key] = FetchCoalescer(fetch)
+
+            return await coalescer.add(
+                id_sequence, self._fetch_coalescing_window, FETCH_COALESCING_MAX_IDS
             )
+
+        return await self._fetch(
+            id_sequence,
+            include_vectors,
+            include_metadata,
+            namespace,
+            include_data,
+            max_concurrency,
+        )
+
+    async def _fetch(
+        self,
+        id_sequence: Sequence[str],
+        include_vectors: bool,
+        include_metadata: bool,
+        namespace: str,
+        include_data: bool,
+        max_concurrency: int,
+    ) -> List[Optional[FetchResult]]:
+        path = _path_for(namespace, FETCH_PATH)
+
+        def fetch_batch(batch: Sequence[str]) -> Awaitable[Any]:
+            return self._execute_request_async(
+                payload={
+                    "ids": batch,
+                    "includeVectors": include_vectors,
+                    "includeMetadata": include_metadata,
+                    "includeData": include_data,
+                },
+                path=path,
+            )
+
+        unique_ids = _unique_ids(id_sequence)
+        batches = _batched(unique_ids, ID_BATCH_SIZE)
+        if len(batches) == 1:
+            # awaited directly, as gathering a single request
+            # costs more than the request is split for.
+            results = [await fetch_batch(batches[0])]
+        else:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def bounded_fetch_batch(batch: Sequence[str]) -> Any:
+                async with semaphore:
+                    return await fetch_batch(batch)
+
+            results = await asyncio.gather(*map(bounded_fetch_batch, batches))
+
+        parse = _fetch_result_parser(include_vectors, include_metadata, include_data)
+        fetched = [
+            parse(vector) if vector else None for result in results for vector in result
         ]
 
+        if unique_ids is not id_sequence:
+            by_id = dict(zip(unique_ids, fetched))
+            return [by_id[id] for id in id_sequence]
+
+        return fetched
+
     async def update(
         self,
         id: str,
-        vector: Optional[List[float]] = None,
+        vector: Optional[Union[Sequence[float], SupportsToList]] = None,
         data: Optional[str] = None,
         metadata: Optional[Dict] = None,
         namespace: str = DEFAULT_NAMESPACE,
         metadata_update_mode: MetadataUpdateMode = MetadataUpdateMode.OVERWRITE,
+        wait: bool = True,
     ) -> bool:
         """
         Updates a vector value, data, or metadata for the given id.
@@ -996,6 +1948,10 @@ class AsyncIndexOperations:
         :param metadata_update_mode: Whether to overwrite the whole
             it, or patch the metadata (insert new fields or update
             according to the `RFC 7396 JSON Merge Patch` algorithm.
+        :param wait: Whether to wait for the update to complete. When `False`,
+            the update is sent in the background and `True` is returned
+            immediately. Use `flush_writes` to wait for such updates, and
+            to get their errors.
 
         Example usage:
 
@@ -1009,7 +1965,7 @@ class AsyncIndexOperations:
         }
 
         if vector is not None:
-            payload["vector"] = vector
+            payload["vector"] = convert_to_payload_vector(vector)
 
         if data is not None:
             payload["data"] = data
@@ -1017,12 +1973,60 @@ class AsyncIndexOperations:
         if metadata is not None:
             payload["metadata"] = metadata
 
+        if not wait:
+            self._write_in_background(self._update(payload, namespace))
+            return True
+
+        return await self._update(payload, namespace)
+
+    async def _update(self, payload: Dict[str, Any], namespace: str) -> bool:
         result = await self._execute_request_async(
             payload=payload, path=_path_for(namespace, UPDATE_PATH)
         )
+        self._invalidate_caches(namespace)
         updated = result["updated"]
         return updated == 1
 
+    async def update_many(
+        self,
+        requests: Sequence[UpdateRequest],
+        namespace: str = DEFAULT_NAMESPACE,
+        max_concurrency: int = UPDATE_MAX_CONCURRENCY,
+    ) -> List[bool]:
+        """
+        Updates the vector values, data, or metadata of many vectors asynchronously.
+
+        The API has no batch update, so each vector is updated with
+        its own request, and the requests are sent concurrently.
+
+        Returns whether each vector is updated or not, in the order of the requests.
+
+        :param requests: The updates to make. Each of them accepts the same fields as the arguments of `update`.
+        :param namespace: The namespace to use. When not specified, the default namespace is used.
+        :param max_concurrency: Maximum number of requests sent concurrently.
+
+        Example usage:
+
+        ```python
+        updated = await index.update_many(
+            [
+                {"id": "id1", "vector": [0.1, 0.2]},
+                {"id": "id2", "metadata": {"new_field": "new_value"}},
+            ]
+        )
+        ```
+        """
+        if max_concurrency <= 0:
+            raise ClientError("max_concurrency must be greater than 0")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def update(request: UpdateRequest) -> bool:
+            async with semaphore:
+                return await self.update(**request, namespace=namespace)
+
+        return list(await asyncio.gather(*[update(request) for request in requests]))
+
     async def info(self) -> InfoResult:
         """
         Returns the index info asynchronously, including:
@@ -1033,19 +2037,74 @@ class AsyncIndexOperations:
         * Vector dimension
         * Similarity function used
         * Per-namespace vector and pending vector counts
+
+        When the client is created with an `info_ttl`, the info is reused
+        for that many seconds, or until a write is made through the client.
+        Concurrent calls share a single request.
         """
-        return InfoResult._from_json(
-            await self._execute_request_async(payload=None, path=INFO_PATH)
-        )
+        cached = self._info_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        if self._info_ttl <= 0:
+            return InfoResult._from_json(
+                await self._execute_request_async(payload=None, path=INFO_PATH)
+            )
+
+        if self._info_lock is None:
+            self._info_lock = asyncio.Lock()
+
+        async with self._info_lock:
+            # the info might be fetched by another call while waiting
+            cached = self._info_cache
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+
+            generation = self._write_generation
+            result = InfoResult._from_json(
+                await self._execute_request_async(payload=None, path=INFO_PATH)
+            )
+
+            if generation == self._write_generation:
+                self._info_cache = (time.monotonic() + self._info_ttl, result)
+
+            return result
 
     async def list_namespaces(self) -> List[str]:
         """
         Returns the list of names of namespaces.
+
+        When the client is created with an `info_ttl`, the list is reused
+        for that many seconds, or until a write is made through the client.
+        Concurrent calls share a single request.
         """
-        result = await self._execute_request_async(
-            payload=None, path=LIST_NAMESPACES_PATH
-        )
-        return result
+        cached = self._namespaces_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return list(cached[1])
+
+        if self._info_ttl <= 0:
+            result = await self._execute_request_async(
+                payload=None, path=LIST_NAMESPACES_PATH
+            )
+            return result
+
+        if self._namespaces_lock is None:
+            self._namespaces_lock = asyncio.Lock()
+
+        async with self._namespaces_lock:
+            # the list might be fetched by another call while waiting
+            cached = self._namespaces_cache
+            if cached is not None and time.monotonic() < cached[0]:
+                return list(cached[1])
+
+            generation = self._write_generation
+            result = await self._execute_request_async(
+                payload=None, path=LIST_NAMESPACES_PATH
+            )
+            if generation == self._write_generation:
+                self._namespaces_cache = (time.monotonic() + self._info_ttl, result)
+
+            return list(result)
 
     async def delete_namespace(self, namespace: str) -> None:
         """
@@ -1058,6 +2117,7 @@ class AsyncIndexOperations:
         await self._execute_request_async(
             payload=None, path=_path_for(namespace, DELETE_NAMESPACE_PATH)
         )
+        self._invalidate_caches(namespace)
 
 
 class ResumableQueryHandle:
@@ -1089,7 +2149,7 @@ class ResumableQueryHandle:
         """
         payload = {"uuid": self._uid, "additionalK": additional_k}
         result = self._exec_fn(payload, RESUMABLE_QUERY_NEXT_PATH)
-        return [QueryResult._from_json(obj) for obj in result]
+        return list(map(QueryResult._from_json, result))
 
     def stop(self) -> None:
         """
@@ -1132,7 +2192,7 @@ class AsyncResumableQueryHandle:
         """
         payload = {"uuid": self._uid, "additionalK": additional_k}
         result = await self._exec_fn(payload, RESUMABLE_QUERY_NEXT_PATH)
-        return [QueryResult._from_json(obj) for obj in result]
+        return list(map(QueryResult._from_json, result))
 
     async def stop(self) -> None:
         """
@@ -0,0 +1,332 @@
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional, Tuple
+
+from upstash_vector.errors import ClientError
+from upstash_vector.types import QueryResult
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+_Key = Tuple[Any, ...]
+
+
+class _Entry:
+    __slots__ = ("results", "top_k", "slot", "expires_at")
+
+    def __init__(
+        self, results: List[QueryResult], top_k: int, slot: int, expires_at: float
+    ):
+        self.results = results
+        self.top_k = top_k
+        self.slot = slot
+        self.expires_at = expires_at
+
+
+class QueryCache:
+    """
+    An in-process cache for query results.
+
+    Results are looked up in two tiers:
+
+    * An exact tier, keyed by the hash of the query vector (or the raw
+      query data) together with the rest of the query parameters.
+    * An optional similarity tier for vector queries. When `d_thresh` is
+      greater than zero, a query whose cosine distance to a cached query
+      vector with the same parameters is at most `d_thresh` is served from
+      the cache. This tier requires `numpy` to be installed.
+
+    A cached result also serves the queries with the same parameters that
+    ask for fewer results, by returning the first `top_k` of them.
+
+    At most `n` results are kept, and the least recently used ones are evicted
+    first. Writes made through the index the cache is attached to invalidate
+    the cached results of the affected namespace, and the results of the
+    queries that were in flight during such a write are not cached.
+
+    The cache is stale by design. Writes made by other clients do not
+    invalidate it, and the vectors that are upserted but not yet indexed
+    by the server are missing from the results cached in the meantime.
+    When `ttl` is greater than zero, the results are evicted that many
+    seconds after they are cached, which bounds how stale they can be.
+
+    A cache should only be attached to a single index.
+
+    Example usage:
+
+    ```python
+    from upstash_vector import Index, QueryCache
+
+    index = Index(
+        url=<url>,
+        token=<token>,
+        query_cache=QueryCache(n=1024, d_thresh=0.05, ttl=60),
+    )
+    ```
+    """
+
+    def __init__(self, n: int = 1024, d_thresh: float = 0.0, ttl: float = 0.0):
+        if n <= 0:
+            raise ClientError("n must be greater than 0")
+
+        if d_thresh < 0:
+            raise ClientError("d_thresh must not be negative")
+
+        if ttl < 0:
+            raise ClientError("ttl must not be negative")
+
+        if d_thresh > 0 and np is None:
+            raise ClientError(
+                "numpy is required for the similarity tier of the query cache"
+            )
+
+        self._n = n
+        self._d_thresh = d_thresh
+        self._ttl = ttl
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[_Key, _Entry]" = OrderedDict()
+
+        # similarity tier, stored as a contiguous matrix of normalized
+        # query vectors, one row per cache slot.
+        self._matrix: Any = None
+        self._slot_keys: List[Optional[_Key]] = [None] * n
+        self._slot_groups: Any = None
+        self._slot_top_k: Any = None
+        # the group of a slot identifies the rest of the query parameters,
+        # and a group is dropped when its last slot is released.
+        self._groups: Dict[_Key, int] = {}
+        self._group_params: Dict[int, _Key] = {}
+        self._group_sizes: Dict[int, int] = {}
+        self._next_group = 0
+        self._free_slots = list(range(n - 1, -1, -1))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """
+        A counter that is incremented on every invalidation. It is read
+        before sending a query, and passed to `update` with its results.
+        """
+        return self._generation
+
+    def get(
+        self,
+        namespace: str,
+        payload: Dict[str, Any],
+        key: Optional[_Key] = None,
+    ) -> Optional[List[QueryResult]]:
+        """
+        Returns the cached results for the given query payload, or `None`
+        if there are no such results.
+
+        The `key` of the payload, as returned from `request_key`, can be
+        given when it is already computed.
+        """
+        if key is None:
+            key = request_key(namespace, payload)
+        params = key[0]
+        top_k = payload["topK"]
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.top_k < top_k:
+                if "vector" not in payload:
+                    return None
+
+                similar_key = self._find_similar(params, payload["vector"], top_k)
+                if similar_key is None:
+                    return None
+
+                key = similar_key
+                entry = self._entries[key]
+
+            if self._ttl > 0 and time.monotonic() >= entry.expires_at:
+                del self._entries[key]
+                self._release(entry.slot)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry.results[:top_k]
+
+    def update(
+        self,
+        namespace: str,
+        payload: Dict[str, Any],
+        results: List[QueryResult],
+        generation: Optional[int] = None,
+        key: Optional[_Key] = None,
+    ) -> None:
+        """
+        Stores the results of the given query payload in the cache.
+
+        When a `generation` is given, and the cache is invalidated since it
+        was read, the results are not stored, as they might be from before
+        the write that invalidated the cache.
+        """
+        if key is None:
+            key = request_key(namespace, payload)
+        params = key[0]
+        top_k = payload["topK"]
+        expires_at = time.monotonic() + self._ttl
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                if top_k >= entry.top_k:
+                    entry.results = list(results)
+                    entry.top_k = top_k
+                    entry.expires_at = expires_at
+                    if self._slot_top_k is not None:
+                        self._slot_top_k[entry.slot] = top_k
+
+                self._entries.move_to_end(key)
+                return
+
+            if not self._free_slots:
+                _, evicted = self._entries.popitem(last=False)
+                self._release(evicted.slot)
+
+            slot = self._free_slots.pop()
+            self._entries[key] = _Entry(list(results), top_k, slot, expires_at)
+            self._slot_keys[slot] = key
+
+            if self._d_thresh > 0 and "vector" in payload:
+                self._store_vector(slot, params, payload["vector"], top_k)
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """
+        Removes the cached results of the given namespace, or all of the
+        cached results when no namespace is given.
+        """
+        with self._lock:
+            self._generation += 1
+
+            if namespace is None:
+                keys = list(self._entries)
+            else:
+                keys = [key for key in self._entries if key[0][0] == namespace]
+
+            for key in keys:
+                self._release(self._entries.pop(key).slot)
+
+    def clear(self) -> None:
+        """
+        Removes all of the cached results.
+        """
+        self.invalidate()
+
+    def _release(self, slot: int) -> None:
+        self._slot_keys[slot] = None
+        if self._slot_groups is not None:
+            group = int(self._slot_groups[slot])
+            if group >= 0:
+                self._slot_groups[slot] = -1
+                self._group_sizes[group] -= 1
+                if self._group_sizes[group] == 0:
+                    del self._group_sizes[group]
+                    del self._groups[self._group_params.pop(group)]
+
+        self._free_slots.append(slot)
+
+    def _store_vector(
+        self, slot: int, params: _Key, vector: List[float], top_k: int
+    ) -> None:
+        q = _normalize(vector)
+        if q is None:
+            return
+
+        if self._matrix is None:
+            self._matrix = np.zeros((self._n, q.shape[0]), dtype=np.float32)
+            self._slot_groups = np.full(self._n, -1, dtype=np.int64)
+            self._slot_top_k = np.zeros(self._n, dtype=np.int64)
+        elif self._matrix.shape[1] != q.shape[0]:
+            return
+
+        group = self._groups.get(params)
+        if group is None:
+            group = self._groups[params] = self._next_group
+            self._group_params[group] = params
+            self._group_sizes[group] = 0
+            self._next_group += 1
+
+        self._group_sizes[group] += 1
+        self._matrix[slot] = q
+        self._slot_groups[slot] = group
+        self._slot_top_k[slot] = top_k
+
+    def _find_similar(
+        self, params: _Key, vector: List[float], top_k: int
+    ) -> Optional[_Key]:
+        if self._d_thresh <= 0 or self._matrix is None:
+            return None
+
+        group = self._groups.get(params)
+        if group is None:
+            return None
+
+        q = _normalize(vector)
+        if q is None or q.shape[0] != self._matrix.shape[1]:
+            return None
+
+        similarities = self._matrix @ q
+        similarities[
+            (self._slot_groups != group) | (self._slot_top_k < top_k)
+        ] = -np.inf
+
+        slot = int(np.argmax(similarities))
+        if 1.0 - similarities[slot] > self._d_thresh:
+            return None
+
+        return self._slot_keys[slot]
+
+
+def request_key(namespace: str, payload: Dict[str, Any]) -> _Key:
+    """
+    Returns a key that identifies the query payload sent to the given
+    namespace, regardless of its `topK`.
+    """
+    return _exact_key(_params_key(namespace, payload), payload)
+
+
+def _params_key(namespace: str, payload: Dict[str, Any]) -> _Key:
+    return (
+        namespace,
+        payload["includeVectors"],
+        payload["includeMetadata"],
+        payload["includeData"],
+        payload["filter"],
+    )
+
+
+def _exact_key(params: _Key, payload: Dict[str, Any]) -> _Key:
+    if "data" in payload:
+        return params, "data", blake2b(payload["data"].encode()).digest()
+
+    vector = payload["vector"]
+    if np is not None and isinstance(vector, np.ndarray):
+        vector_bytes = vector.astype(np.float64).tobytes()
+    else:
+        vector_bytes = array("d", vector).tobytes()
+
+    return params, "vector", blake2b(vector_bytes).digest()
+
+
+def _normalize(vector: List[float]) -> Any:
+    q = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(q)
+    if q.ndim != 1 or norm == 0:
+        return None
+
+    return q / norm
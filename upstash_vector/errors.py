@@ -1,6 +1,20 @@
+from typing import List
+
+
 class UpstashError(Exception):
     pass
 
 
 class ClientError(Exception):
     pass
+
+
+class BackgroundWriteError(Exception):
+    """
+    Raised when more than one of the writes made in the background has
+    failed. The errors of the failed writes are in `errors`.
+    """
+
+    def __init__(self, errors: List[BaseException]):
+        super().__init__(f"{len(errors)} background writes failed: {errors[0]!r}")
+        self.errors = errors
@@ -1,18 +1,144 @@
 import asyncio
+import gzip
+import json
 import os
+import threading
 import time
 from platform import python_version
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple, Union
 
 from httpx import Client, AsyncClient
 
 from upstash_vector import __version__
-from upstash_vector.errors import UpstashError
+from upstash_vector.errors import ClientError, UpstashError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+SERIALIZES_NUMPY = orjson is not None
+"""Whether numpy arrays can be serialized without converting them to lists."""
+
+COMPRESSION_THRESHOLD = 16384
+"""Minimum size of the request bodies, in bytes, that are compressed."""
+
+# non-str keys are accepted by the standard library, which was used
+# before orjson, so they are accepted by orjson as well.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+# zstd compressors are not safe to share between threads, so each
+# thread gets its own, and reuses it for the following requests.
+_compressors = threading.local()
+
+
+def dumps(payload: Any) -> Optional[bytes]:
+    """
+    Serializes the payload to JSON, using `orjson` when it is installed.
+    """
+    if payload is None:
+        return None
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects some of the values the standard library
+            # accepts, such as the integers larger than 64 bits.
+            pass
+
+    return json.dumps(payload, default=_to_list).encode()
+
+
+def _to_list(obj: Any) -> Any:
+    # numpy arrays are passed as they are when orjson is installed,
+    # so they might reach the standard library as well.
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(content: bytes) -> Any:
+    """
+    Deserializes the JSON content, using `orjson` when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def compression_encoding(compress: Union[bool, str]) -> Optional[str]:
+    """
+    Returns the content encoding of the given `compress` option of the
+    clients, which is `None` when the request bodies are not compressed.
+
+    `True` means gzip, which does not need any extra dependency. zstd is
+    only used when it is asked for explicitly.
+    """
+    if compress is False:
+        return None
+
+    if compress is True or compress == "gzip":
+        return "gzip"
+
+    if compress == "zstd":
+        if zstandard is None:
+            raise ClientError("zstandard is required for zstd compression")
+
+        return "zstd"
+
+    raise ClientError(f"Unsupported compression: {compress}")
+
+
+def compress(content: bytes, encoding: str = "gzip") -> bytes:
+    """
+    Compresses the content with the given content encoding, gzip or zstd.
+    Both use a low compression level, as the compression is done on the
+    request path.
+    """
+    if encoding == "zstd":
+        compressor = getattr(_compressors, "zstd", None)
+        if compressor is None:
+            compressor = _compressors.zstd = zstandard.ZstdCompressor(level=3)
+
+        return compressor.compress(content)
+
+    return gzip.compress(content, compresslevel=1)
+
+
+def _encode_payload(
+    payload: Any, compression: Optional[str]
+) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+    """
+    Returns the content of the request, and the headers to send in
+    addition to the ones of the client, if there are any.
+    """
+    content = dumps(payload)
+
+    if compression is not None and content is not None:
+        if len(content) >= COMPRESSION_THRESHOLD:
+            return compress(content, compression), {"Content-Encoding": compression}
+
+    return content, None
 
 
 def generate_headers(token) -> Dict[str, str]:
+    """
+    Returns the headers sent with every request. They are set on the HTTP
+    client once, instead of being passed to and merged on each request.
+    """
     headers = {
         "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
         "Upstash-Telemetry-Sdk": f"upstash-vector-py@v{__version__}",
         "Upstash-Telemetry-Runtime": f"python@v{python_version()}",
     }
@@ -32,17 +158,18 @@ def generate_headers(token) -> Dict[str, str]:
 def execute_with_parameters(
     url: str,
     client: Client,
-    headers: Dict[str, str],
     retries: int,
     retry_interval: float,
     payload: Any,
+    compression: Optional[str] = None,
 ) -> Any:
     response = None
     last_error = None
+    content, headers = _encode_payload(payload, compression)
 
     for attempts_left in range(max(0, retries), -1, -1):
         try:
-            response = client.post(url=url, headers=headers, json=payload)
+            response = client.post(url=url, headers=headers, content=content)
             break
 
         except Exception as e:
@@ -54,7 +181,7 @@ def execute_with_parameters(
         assert last_error is not None
         raise last_error
 
-    body = response.json()
+    body = loads(response.content)
     if "error" in body:
         raise UpstashError(body["error"])
 
@@ -64,17 +191,18 @@ def execute_with_parameters(
 async def execute_with_parameters_async(
     client: AsyncClient,
     url: str,
-    headers: Dict[str, str],
     retries: int,
     retry_interval: float,
     payload: Any,
+    compression: Optional[str] = None,
 ) -> Any:
     response = None
     last_error = None
+    content, headers = _encode_payload(payload, compression)
 
     for attempts_left in range(max(0, retries), -1, -1):
         try:
-            response = await client.post(url=url, headers=headers, json=payload)
+            response = await client.post(url=url, headers=headers, content=content)
             break
 
         except Exception as e:
@@ -86,7 +214,7 @@ async def execute_with_parameters_async(
         assert last_error is not None
         raise last_error
 
-    body = response.json()
+    body = loads(response.content)
     if "error" in body:
         raise UpstashError(body["error"])
 
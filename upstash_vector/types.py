@@ -1,6 +1,17 @@
 import enum
+import sys
 from dataclasses import dataclass
-from typing import Optional, List, Dict, TypedDict, Union, Protocol
+from typing import Any, Optional, List, Dict, TypedDict, Union, Protocol
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# slots save the per-instance dict of the types created in bulk
+# while building the requests and parsing the responses, but they
+# can only be generated by dataclass in Python 3.10 and later.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class SupportsToList(Protocol):
@@ -8,7 +19,7 @@ class SupportsToList(Protocol):
         ...
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Vector:
     id: Union[int, str]
     vector: Union[List[float], SupportsToList]
@@ -16,14 +27,14 @@ class Vector:
     data: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Data:
     id: Union[int, str]
     data: str
     metadata: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FetchResult:
     id: str
     vector: Optional[List[float]] = None
@@ -32,15 +43,19 @@ class FetchResult:
 
     @classmethod
     def _from_json(cls, obj: dict) -> "FetchResult":
-        return cls(
-            id=obj["id"],
-            vector=obj.get("vector"),
-            metadata=obj.get("metadata"),
-            data=obj.get("data"),
-        )
+        # positional arguments, in the order of the fields, as this
+        # is called for every vector in the fetch and range responses.
+        get = obj.get
+        return cls(obj["id"], get("vector"), get("metadata"), get("data"))
 
+    @classmethod
+    def _from_json_without_fields(cls, obj: dict) -> "FetchResult":
+        # for the fetches and ranges that include neither the vectors,
+        # metadata nor data, whose responses only have the ids.
+        return cls(obj["id"])
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class QueryResult:
     id: str
     score: float
@@ -50,13 +65,16 @@ class QueryResult:
 
     @classmethod
     def _from_json(cls, obj: dict) -> "QueryResult":
-        return cls(
-            id=obj["id"],
-            score=obj["score"],
-            vector=obj.get("vector"),
-            metadata=obj.get("metadata"),
-            data=obj.get("data"),
-        )
+        # positional arguments, in the order of the fields, as this
+        # is called for every vector in the query responses.
+        get = obj.get
+        return cls(obj["id"], obj["score"], get("vector"), get("metadata"), get("data"))
+
+    @classmethod
+    def _from_json_without_fields(cls, obj: dict) -> "QueryResult":
+        # for the queries that include neither the vectors, metadata
+        # nor data, whose responses only have the ids and scores.
+        return cls(obj["id"], obj["score"])
 
 
 @dataclass
@@ -68,7 +86,7 @@ class DeleteResult:
         return cls(deleted=obj["deleted"])
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RangeResult:
     next_cursor: str
     vectors: List[FetchResult]
@@ -77,10 +95,60 @@ class RangeResult:
     def _from_json(cls, obj: dict) -> "RangeResult":
         return cls(
             next_cursor=obj["nextCursor"],
-            vectors=[FetchResult._from_json(v) for v in obj["vectors"]],
+            vectors=list(map(FetchResult._from_json, obj["vectors"])),
+        )
+
+    @classmethod
+    def _from_json_without_fields(cls, obj: dict) -> "RangeResult":
+        return cls(
+            next_cursor=obj["nextCursor"],
+            vectors=list(map(FetchResult._from_json_without_fields, obj["vectors"])),
         )
 
 
+@dataclass
+class ColumnarRangeResult:
+    """
+    The result of a range, with each field of the vectors in its own column.
+
+    The columns that are not included in the range are `None`. The vector
+    values are a `numpy.ndarray` of float32, with a row for each vector.
+    """
+
+    next_cursor: str
+    ids: List[str]
+    vectors: Optional[Any] = None
+    metadata: Optional[List[Optional[Dict]]] = None
+    data: Optional[List[Optional[str]]] = None
+
+    @classmethod
+    def _from_json(
+        cls,
+        obj: dict,
+        include_vectors: bool,
+        include_metadata: bool,
+        include_data: bool,
+    ) -> "ColumnarRangeResult":
+        records = obj["vectors"]
+        result = cls(next_cursor=obj["nextCursor"], ids=[r["id"] for r in records])
+
+        if include_vectors:
+            if records:
+                result.vectors = np.array(
+                    [r["vector"] for r in records], dtype=np.float32
+                )
+            else:
+                result.vectors = np.empty((0, 0), dtype=np.float32)
+
+        if include_metadata:
+            result.metadata = [r.get("metadata") for r in records]
+
+        if include_data:
+            result.data = [r.get("data") for r in records]
+
+        return result
+
+
 @dataclass
 class NamespaceInfo:
     vector_count: int
@@ -181,3 +249,35 @@ class QueryRequest(TypedDict, total=False):
     
     When not specified, defaults to `""`(no filter).
     """
+
+
+class _UpdateRequestId(TypedDict):
+    id: str
+    """
+    The id of the vector to update.
+    """
+
+
+class UpdateRequest(_UpdateRequestId, total=False):
+    vector: Union[List[float], SupportsToList]
+    """
+    The vector value to update to.
+    """
+
+    data: str
+    """
+    The raw text data to update to.
+    """
+
+    metadata: Dict
+    """
+    The metadata to update to.
+    """
+
+    metadata_update_mode: MetadataUpdateMode
+    """
+    Whether to overwrite the whole metadata while updating it,
+    or patch the metadata according to Merge Patch algorithm.
+
+    When not specified, defaults to `MetadataUpdateMode.OVERWRITE`.
+    """
@@ -1,8 +1,61 @@
-from typing import List, Union, Dict, Any, Optional, Tuple
+import math
+from collections.abc import Sequence
+from typing import List, Union, Dict, Any, Optional, Tuple, Callable
 
 from upstash_vector.errors import ClientError
+from upstash_vector.http import SERIALIZES_NUMPY
 from upstash_vector.types import Data, QueryRequest, Vector
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+def convert_to_payload_vector(obj):
+    """
+    Converts the vector to a value that can be serialized into a request payload.
+
+    One dimensional numpy arrays are sent as contiguous float32 arrays without
+    creating a Python float for each element, when the serializer supports it.
+    float32 is also the precision the vectors are stored with, and its shortest
+    decimal representation is about half as long as the float64 one. Arrays of
+    lower precision, like float16, are widened to float32 losslessly.
+    Other values, like tuples or pandas series, are converted to lists.
+    """
+    if isinstance(obj, list):
+        return obj
+
+    if SERIALIZES_NUMPY and np is not None and isinstance(obj, np.ndarray):
+        if obj.ndim == 1:
+            return np.ascontiguousarray(obj, dtype=np.float32)
+
+    if isinstance(obj, Sequence) and not isinstance(obj, str):
+        return list(obj)
+
+    return convert_to_list(obj)
+
+
+def normalize_vector(obj):
+    """
+    Scales the vector to unit length, and converts it to a value that can be
+    serialized into a request payload. Zero vectors are left as they are.
+    """
+    if np is not None:
+        vector = np.asarray(obj, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector = vector / norm
+
+        return convert_to_payload_vector(vector)
+
+    values = convert_to_list(obj)
+    norm = math.sqrt(math.fsum(value * value for value in values))
+    if norm == 0:
+        return values
+
+    return [value / norm for value in values]
+
 
 def convert_to_list(obj):
     if isinstance(obj, list):
@@ -15,16 +68,40 @@ def convert_to_list(obj):
     )
 
 
+def _vector_payload(
+    id: Union[int, str],
+    vector: Any,
+    metadata: Optional[Dict[str, Any]],
+    data: Optional[str],
+) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "vector": convert_to_payload_vector(vector),
+        "metadata": metadata,
+        "data": data,
+    }
+
+
+def _data_payload(
+    id: Union[int, str], data: str, metadata: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "data": data,
+        "metadata": metadata,
+    }
+
+
 def _get_payload_element(
     id: Union[int, str],
     payload: Union[str, List[float]],
     metadata: Optional[Dict[str, Any]] = None,
     data: Optional[str] = None,
-) -> Union[Vector, Data]:
+) -> Tuple[Dict[str, Any], bool]:
     if isinstance(payload, str):
-        return Data(id=id, data=payload, metadata=metadata)
+        return _data_payload(id, payload, metadata), False
 
-    return Vector(id=id, vector=convert_to_list(payload), metadata=metadata, data=data)
+    return _vector_payload(id, payload, metadata, data), True
 
 
 def _get_payload_element_from_dict(
@@ -32,7 +109,7 @@ def _get_payload_element_from_dict(
     vector: Optional[List[float]] = None,
     data: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None,
-) -> Union[Vector, Data]:
+) -> Tuple[Dict[str, Any], bool]:
     if vector is None and data is None:
         raise ClientError(
             "Vector dict must have one of `vector` or `data` fields defined."
@@ -40,71 +117,81 @@ def _get_payload_element_from_dict(
 
     if vector is None:
         # data cannot be none at this point
-        return Data(id=id, data=data, metadata=metadata)  # type:ignore[arg-type]
+        return _data_payload(id, data, metadata), False  # type:ignore[arg-type]
+
+    return _vector_payload(id, vector, metadata, data), True
+
+
+def _vector_to_payload(vector: Vector) -> Tuple[Dict[str, Any], bool]:
+    return _vector_payload(vector.id, vector.vector, vector.metadata, vector.data), True
+
+
+def _data_to_payload(data: Data) -> Tuple[Dict[str, Any], bool]:
+    return _data_payload(data.id, data.data, data.metadata), False
 
-    return Vector(id=id, vector=convert_to_list(vector), metadata=metadata, data=data)
 
+def _tuple_to_payload(vector: tuple) -> Tuple[Dict[str, Any], bool]:
+    return _get_payload_element(*vector)
 
-def _tuple_or_dict_to_vectors(vector) -> Union[Vector, Data]:
+
+def _dict_to_payload(vector: dict) -> Tuple[Dict[str, Any], bool]:
+    return _get_payload_element_from_dict(**vector)
+
+
+def _any_to_payload(vector: Any) -> Tuple[Dict[str, Any], bool]:
     if isinstance(vector, Vector):
-        vector.vector = convert_to_list(vector.vector)
-        return vector
+        return _vector_to_payload(vector)
     elif isinstance(vector, Data):
-        return vector
+        return _data_to_payload(vector)
     elif isinstance(vector, tuple):
-        return _get_payload_element(*vector)
+        return _tuple_to_payload(vector)
     elif isinstance(vector, dict):
-        return _get_payload_element_from_dict(**vector)
+        return _dict_to_payload(vector)
     else:
         raise ClientError(
             f"Given object type is undefined for converting to vector: {vector}"
         )
 
 
-def convert_to_vectors(vectors) -> List[Union[Vector, Data]]:
-    return [_tuple_or_dict_to_vectors(vector) for vector in vectors]
+_PAYLOAD_BUILDERS: Dict[type, Callable[[Any], Tuple[Dict[str, Any], bool]]] = {
+    Vector: _vector_to_payload,
+    Data: _data_to_payload,
+    tuple: _tuple_to_payload,
+    dict: _dict_to_payload,
+}
 
 
-def convert_to_payload(
-    vectors: List[Union[Vector, Data]],
-) -> Tuple[List[Dict[str, Any]], bool]:
+def build_upsert_payload(vectors) -> Tuple[List[Dict[str, Any]], bool]:
     """
-    Converts a list of Vector or Data to payload.
+    Converts a sequence of Vector, Data, tuples or dicts to the upsert payload,
+    in a single pass.
 
-    The list can only contain one of the two types. Otherwise, raises
-    an exception.
+    The sequence can only contain vectors or data, but not both. Otherwise,
+    raises an exception.
 
-    Returns the payload and whether it is Vector or Data.
+    Returns the payload and whether it contains vectors or data.
     """
-    expecting_vectors = isinstance(vectors[0], Vector)
-    payload = []
+    # Dispatch on the exact type of the items, so that the common kinds skip
+    # the isinstance chain. Subclasses fall back to it.
+    get_builder = _PAYLOAD_BUILDERS.get
+    payload: List[Dict[str, Any]] = []
+    append = payload.append
+    expecting_vectors = None
+
     for vector in vectors:
-        is_vector = isinstance(vector, Vector)
-        if expecting_vectors != is_vector:
+        element, is_vector = get_builder(type(vector), _any_to_payload)(vector)
+
+        if expecting_vectors is None:
+            expecting_vectors = is_vector
+        elif expecting_vectors != is_vector:
             raise ClientError(
                 "All items should either have the `data` or the `vector` field."
                 " Received items from both kinds. Please send them separately."
             )
 
-        if is_vector:
-            payload.append(
-                {
-                    "id": vector.id,
-                    "vector": vector.vector,  # type: ignore[union-attr]
-                    "metadata": vector.metadata,
-                    "data": vector.data,
-                }
-            )
-        else:
-            payload.append(
-                {
-                    "id": vector.id,
-                    "data": vector.data,
-                    "metadata": vector.metadata,
-                }
-            )
+        append(element)
 
-    return payload, expecting_vectors
+    return payload, bool(expecting_vectors)
 
 
 def convert_query_requests_to_payload(
@@ -149,7 +236,7 @@ def convert_query_requests_to_payload(
                 )
 
             has_vector_query = True
-            payload["vector"] = convert_to_list(vector)
+            payload["vector"] = convert_to_payload_vector(vector)
 
         payloads.append(payload)
 